@@ -18,5 +18,5 @@ print(f"Agents seen : {summary['agents']}")
 # Per-agent breakdown
 for agent_id in summary["agents"]:
     records = meter.records_for_agent(agent_id)
-    tokens = sum(r.total_tokens for r in records)
+    tokens = summary["tokens_by_agent"][agent_id]
     print(f"  {agent_id}: {len(records)} task(s), {tokens} tokens")
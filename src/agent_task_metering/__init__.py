@@ -1,6 +1,11 @@
 """agent-task-metering: track and meter AI agent task usage."""
 
-from .audit_logger import AuditLogger, get_audit_logger
+from .audit_logger import (
+    AsyncAuditSink,
+    AuditLogger,
+    BatchedAuditHandler,
+    get_audit_logger,
+)
 from .evaluation import (
     AuditRecord,
     AuditStore,
@@ -18,9 +23,11 @@ from .models import TaskRecord
 __version__ = "0.1.0"
 __all__ = [
     "AnomalyRecord",
+    "AsyncAuditSink",
     "AuditLogger",
     "AuditRecord",
     "AuditStore",
+    "BatchedAuditHandler",
     "ContractConfig",
     "Evidence",
     "EvaluationRequest",
@@ -0,0 +1,10 @@
+"""Small helpers for supporting every Python version in ``requires-python``."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Dict
+
+# ``@dataclass(**DATACLASS_SLOTS)`` adds ``__slots__`` (no per-instance
+# ``__dict__``) on Python 3.10+, and is a no-op on 3.9.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
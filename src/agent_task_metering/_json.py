@@ -0,0 +1,44 @@
+"""JSON encode/decode helpers shared by the REST API, audit logger and metering client.
+
+Uses :mod:`orjson` when it is installed (``pip install
+agent-task-metering[fast]``) and falls back to the standard library
+:mod:`json` module otherwise.  Both paths produce compact UTF-8 ``bytes``
+and stringify values they cannot encode natively.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - exercised only when orjson is installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Encode *obj* as compact JSON bytes."""
+        return orjson.dumps(obj, default=str)
+
+    def dumps_indented(obj: Any) -> str:
+        """Encode *obj* as human-readable JSON text (2-space indent)."""
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+
+    loads = orjson.loads
+
+else:
+    _encode = json.JSONEncoder(default=str, separators=(",", ":")).encode
+
+    def dumps(obj: Any) -> bytes:
+        """Encode *obj* as compact JSON bytes."""
+        return _encode(obj).encode()
+
+    def dumps_indented(obj: Any) -> str:
+        """Encode *obj* as human-readable JSON text (2-space indent)."""
+        return json.dumps(obj, default=str, indent=2)
+
+    loads = json.loads
+
+__all__ = ["dumps", "dumps_indented", "loads"]
@@ -12,24 +12,39 @@ Usage::
 
     logger = get_audit_logger()
     logger.log_event("evaluation_decision", correlation_id="abc", ...)
+
+Set ``AUDIT_BATCHED=1`` to write through a :class:`BatchedAuditHandler`
+(group commit on a background thread) instead of one write per event.
 """
 
 from __future__ import annotations
 
-import json
+import atexit
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import IO, Any, Dict, List, Optional
+
+from . import _json
 
 _LOGGER_NAME = "agent_task_metering.audit"
 
+# Billing-critical events: the batched handler does not return until these
+# (and everything queued before them) have been written.
+_SYNC_EVENTS = frozenset({"marketplace_submission", "guardrail_cap_exceeded"})
+
 
 class _JsonFormatter(logging.Formatter):
     """Emit each log record as a single JSON line."""
 
     def format(self, record: logging.LogRecord) -> str:
         payload: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -37,7 +52,122 @@ class _JsonFormatter(logging.Formatter):
         extra = getattr(record, "_structured", None)
         if extra:
             payload.update(extra)
-        return json.dumps(payload, default=str)
+        return _json.dumps(payload).decode()
+
+
+# Queue marker that ends the current group so it is written immediately.
+_FLUSH: Any = object()
+
+
+class BatchedAuditHandler(logging.Handler):
+    """Queue log records and write them in groups from a background thread.
+
+    The writer drains up to *max_batch* records, or whatever arrives within
+    *max_delay* seconds of the first one, and writes them with a single
+    ``write`` + ``flush`` (+ ``os.fsync`` when *fsync* is set).  Records for
+    billing-critical events (``marketplace_submission``,
+    ``guardrail_cap_exceeded``) or at ``WARNING`` and above block the caller
+    until they are written.  A full queue blocks rather than dropping
+    records.
+
+    Parameters
+    ----------
+    stream : file-like, optional
+        Destination text stream (default ``sys.stderr``).
+    max_batch : int
+        Maximum records per group write.
+    max_delay : float
+        Seconds to wait for more records after the first of a group.
+    maxsize : int
+        Queue capacity before :meth:`emit` applies back-pressure.
+    fsync : bool
+        ``os.fsync`` the stream's file descriptor after each group.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[IO[str]] = None,
+        max_batch: int = 256,
+        max_delay: float = 0.005,
+        maxsize: int = 10_000,
+        fsync: bool = False,
+    ) -> None:
+        super().__init__()
+        self._stream = stream if stream is not None else sys.stderr
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._fsync = fsync
+        self.setFormatter(_JsonFormatter())
+        self._queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(maxsize)
+        self._writer = threading.Thread(
+            target=self._run, name="audit-group-commit", daemon=True
+        )
+        self._writer.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not self._writer.is_alive():
+            # Closed, or the writer died: nothing would drain the queue.
+            self._write([record])
+            return
+        self._queue.put(record)
+        structured = getattr(record, "_structured", None) or {}
+        if record.levelno >= logging.WARNING or structured.get("event") in _SYNC_EVENTS:
+            self._queue.put(_FLUSH)  # write now rather than after max_delay
+            self._queue.join()
+
+    def flush(self) -> None:
+        """Block until every queued record has been written."""
+        if self._writer.is_alive():
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        super().close()
+
+    def _run(self) -> None:
+        get = self._queue.get
+        while True:
+            first = get()
+            batch: List[Optional[logging.LogRecord]] = [first]
+            deadline = time.monotonic() + self._max_delay
+            while first is not None and first is not _FLUSH and len(batch) < self._max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = get(timeout=timeout)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                if item is None or item is _FLUSH:
+                    break
+            records = [r for r in batch if r is not None and r is not _FLUSH]
+            try:
+                if records:
+                    self._write(records)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if batch[-1] is None:
+                return
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.format(record))
+            except Exception:  # noqa: BLE001 — mirror logging.Handler semantics
+                self.handleError(record)
+        try:
+            self._stream.write("\n".join(lines) + "\n")
+            self._stream.flush()
+            if self._fsync:
+                os.fsync(self._stream.fileno())
+        except Exception:  # noqa: BLE001
+            self.handleError(records[-1])
 
 
 def get_audit_logger(name: str = _LOGGER_NAME) -> "AuditLogger":
@@ -62,10 +192,15 @@ class AuditLogger:
         self._logger = logging.getLogger(name)
         # Attach JSON handler only once per logger name.
         if not self._logger.handlers:
-            handler = logging.StreamHandler()
+            handler: logging.Handler
+            if os.environ.get("AUDIT_BATCHED") == "1":
+                handler = BatchedAuditHandler()
+            else:
+                handler = logging.StreamHandler()
             handler.setFormatter(_JsonFormatter())
             self._logger.addHandler(handler)
             self._logger.setLevel(logging.DEBUG)
+        self._enabled = self._logger.isEnabledFor
 
     def log_event(
         self,
@@ -87,10 +222,15 @@ class AuditLogger:
             Python logging level (default ``INFO``).
         **fields
             Arbitrary key-value pairs included in the JSON payload.
+
+        When *level* is disabled for this logger nothing is emitted and
+        only ``event`` (plus ``correlation_id``, if given) is returned.
         """
         structured: Dict[str, Any] = {"event": event}
         if correlation_id is not None:
             structured["correlation_id"] = correlation_id
+        if not self._enabled(level):
+            return structured
         structured.update(fields)
 
         record = self._logger.makeRecord(
@@ -105,3 +245,82 @@ class AuditLogger:
         record._structured = structured  # type: ignore[attr-defined]
         self._logger.handle(record)
         return structured
+
+
+# Queued by AsyncAuditSink.close to stop its worker.
+_STOP: Any = object()
+
+
+class AsyncAuditSink:
+    """Hand audit events to a background thread that logs them in order.
+
+    :meth:`push` only enqueues a small tuple; the event's dict, JSON and
+    I/O are built on the worker thread by ``logger.log_event``.  The
+    queue is bounded and blocks when full, so events are never dropped.
+    Events still queued at interpreter exit are written by :meth:`close`.
+
+    Parameters
+    ----------
+    logger : AuditLogger
+        Logger the worker writes through.
+    maxsize : int
+        Queue capacity before :meth:`push` applies back-pressure.
+    """
+
+    def __init__(self, logger: AuditLogger, maxsize: int = 65_536) -> None:
+        self._audit = logger
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize)
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def push(self, event: str, correlation_id: str, fields: Dict[str, Any]) -> None:
+        """Queue *event* for logging with *fields* as its payload."""
+        if self._worker is None:
+            self._start()
+        self._queue.put((event, correlation_id, fields))
+
+    def flush(self) -> None:
+        """Block until every pushed event has been logged."""
+        if self._worker is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Log every pushed event, then stop the worker thread.
+
+        Runs at interpreter exit for any sink whose worker has started.  A
+        later :meth:`push` starts a new worker.
+        """
+        with self._start_lock:
+            worker = self._worker
+            if worker is None:
+                return
+            self._queue.put(_STOP)
+            worker.join()
+            self._worker = None
+            atexit.unregister(self.close)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._worker is None:
+                worker = threading.Thread(
+                    target=self._run, name="audit-async-sink", daemon=True
+                )
+                worker.start()
+                self._worker = worker
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        get = self._queue.get
+        task_done = self._queue.task_done
+        log_event = self._audit.log_event
+        while True:
+            item = get()
+            try:
+                if item is _STOP:
+                    return
+                event, correlation_id, fields = item
+                log_event(event, correlation_id=correlation_id, **fields)
+            except Exception:  # noqa: BLE001 — one bad event must not stop the worker
+                traceback.print_exc()
+            finally:
+                task_done()
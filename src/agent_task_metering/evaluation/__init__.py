@@ -2,7 +2,7 @@
 
 from .audit import AuditStore
 from .contract import ContractConfig, TaskAdherenceContract
-from .evaluator import TaskAdherenceEvaluator
+from .evaluator import TaskAdherenceEvaluator, flush_decision_log
 from .models import AuditRecord, EvaluationRequest, EvaluationResult, Evidence
 
 __all__ = [
@@ -14,4 +14,5 @@ __all__ = [
     "EvaluationResult",
     "TaskAdherenceContract",
     "TaskAdherenceEvaluator",
+    "flush_decision_log",
 ]
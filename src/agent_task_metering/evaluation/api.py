@@ -1,7 +1,9 @@
 """Minimal REST API for task adherence evaluation.
 
 Uses only the Python standard library (``http.server`` + ``json``) so that
-no additional dependencies are required.  The server exposes:
+no additional dependencies are required; :mod:`orjson` is used for JSON
+when installed.  Requests are served on one
+thread each over HTTP/1.1 keep-alive connections.  The server exposes:
 
 * **POST /evaluate** — evaluate a task and return the billable outcome.
 * **POST /evaluate_intent_handling** — evaluate intent resolution only.
@@ -18,11 +20,13 @@ Start with::
 
 from __future__ import annotations
 
-import json
-import uuid
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any, Dict, Optional
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
 
+from .. import _json
+from .._ids import new_correlation_id
 from ..audit_logger import get_audit_logger
 from ..metering.client import MarketplaceMeteringClient
 from .contract import ContractConfig
@@ -35,19 +39,25 @@ _log = get_audit_logger()
 _evaluator: Optional[TaskAdherenceEvaluator] = None
 # Module-level metering client.
 _metering_client: Optional[MarketplaceMeteringClient] = None
+# Guards first-use construction when requests arrive concurrently.
+_init_lock = threading.Lock()
 
 
 def _get_evaluator() -> TaskAdherenceEvaluator:
     global _evaluator  # noqa: PLW0603
     if _evaluator is None:
-        _evaluator = TaskAdherenceEvaluator()
+        with _init_lock:
+            if _evaluator is None:
+                _evaluator = TaskAdherenceEvaluator()
     return _evaluator
 
 
 def _get_metering_client() -> MarketplaceMeteringClient:
     global _metering_client  # noqa: PLW0603
     if _metering_client is None:
-        _metering_client = MarketplaceMeteringClient()
+        with _init_lock:
+            if _metering_client is None:
+                _metering_client = MarketplaceMeteringClient()
     return _metering_client
 
 
@@ -57,10 +67,12 @@ def configure(
 ) -> TaskAdherenceEvaluator:
     """(Re)configure the module-level evaluator and metering client."""
     global _evaluator, _metering_client  # noqa: PLW0603
-    _evaluator = TaskAdherenceEvaluator(config=config)
-    if metering_client is not None:
-        _metering_client = metering_client
-    return _evaluator
+    evaluator = TaskAdherenceEvaluator(config=config)
+    with _init_lock:
+        _evaluator = evaluator
+        if metering_client is not None:
+            _metering_client = metering_client
+    return evaluator
 
 
 # ------------------------------------------------------------------
@@ -68,6 +80,19 @@ def configure(
 # ------------------------------------------------------------------
 
 
+# Required request fields per route.
+_EVALUATION_FIELDS = ("task_id", "agent_id", "subscription_ref")
+_RECORD_FIELDS = ("task_id", "subscription_ref")
+
+
+def _missing_fields_error(raw: Dict[str, Any], fields: tuple) -> Optional[str]:
+    """Return the 400 error message for *raw*, or None if all *fields* are present."""
+    missing = [f for f in fields if f not in raw]
+    if missing:
+        return f"Missing fields: {', '.join(missing)}"
+    return None
+
+
 def _parse_evidence(raw: Dict[str, Any]) -> Evidence:
     """Build an :class:`Evidence` from raw JSON dict."""
     evidence_raw = raw.get("evidence", {})
@@ -88,31 +113,63 @@ def _parse_evidence(raw: Dict[str, Any]) -> Evidence:
 class _Handler(BaseHTTPRequestHandler):
     """HTTP request handler for the evaluation API."""
 
+    # Keep-alive: every response carries Content-Length (see _send_json).
+    protocol_version = "HTTP/1.1"
+
+    # Headers and body go out as two writes; with Nagle on, the body waits
+    # for the client's delayed ACK (~40 ms) on every keep-alive response.
+    disable_nagle_algorithm = True
+
+    # Largest accepted request body (1 MiB); larger bodies get a 413.
+    MAX_BODY = 1 << 20
+
     def _send_json(self, status: int, body: Dict[str, Any]) -> None:
-        payload = json.dumps(body).encode()
+        payload = _json.dumps(body)
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(payload)))
         self.end_headers()
         self.wfile.write(payload)
 
-    def _read_body(self) -> bytes:
-        length = int(self.headers.get("Content-Length", 0))
+    def _read_body(self) -> Optional[bytes]:
+        """Read the request body; send 413 and return None if it is too large.
+
+        Raises ValueError for a malformed Content-Length, after marking the
+        connection for closing.
+        """
+        try:
+            length = int(self.headers.get("Content-Length", 0) or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            # The body cannot be skipped without a length, so drop the connection.
+            self.close_connection = True
+            raise
+        if length > self.MAX_BODY:
+            # The oversized body is left unread, so drop the connection.
+            self.close_connection = True
+            self._send_json(413, {"error": "Payload too large"})
+            return None
+        if length == 0:
+            return b""
         return self.rfile.read(length)
 
     def _read_json(self) -> Optional[Dict[str, Any]]:
-        """Parse request body as JSON; send 400 on failure."""
+        """Parse request body as JSON; send 400/413 on failure."""
         try:
-            return json.loads(self._read_body())
-        except (json.JSONDecodeError, ValueError):
+            body = self._read_body()
+            if body is None:
+                return None
+            return _json.loads(body)
+        except ValueError:  # bad Content-Length, json / orjson JSONDecodeError
             self._send_json(400, {"error": "Invalid JSON"})
             return None
 
     def _require_fields(self, raw: Dict[str, Any], fields: tuple) -> bool:
         """Validate required fields; send 400 on failure. Return True if ok."""
-        missing = [f for f in fields if f not in raw]
-        if missing:
-            self._send_json(400, {"error": f"Missing fields: {', '.join(missing)}"})
+        error = _missing_fields_error(raw, fields)
+        if error is not None:
+            self._send_json(400, {"error": error})
             return False
         return True
 
@@ -122,7 +179,7 @@ class _Handler(BaseHTTPRequestHandler):
         raw = self._read_json()
         if raw is None:
             return
-        if not self._require_fields(raw, ("task_id", "agent_id", "subscription_ref")):
+        if not self._require_fields(raw, _EVALUATION_FIELDS):
             return
 
         evidence = _parse_evidence(raw)
@@ -142,10 +199,10 @@ class _Handler(BaseHTTPRequestHandler):
         raw = self._read_json()
         if raw is None:
             return
-        if not self._require_fields(raw, ("task_id", "agent_id", "subscription_ref")):
+        if not self._require_fields(raw, _EVALUATION_FIELDS):
             return
 
-        correlation_id = raw.get("correlation_id") or uuid.uuid4().hex
+        correlation_id = raw.get("correlation_id") or new_correlation_id()
         evidence = _parse_evidence(raw)
         intent_handled, reason = _get_evaluator().contract.evaluate_intent(evidence)
 
@@ -161,10 +218,10 @@ class _Handler(BaseHTTPRequestHandler):
         raw = self._read_json()
         if raw is None:
             return
-        if not self._require_fields(raw, ("task_id", "agent_id", "subscription_ref")):
+        if not self._require_fields(raw, _EVALUATION_FIELDS):
             return
 
-        correlation_id = raw.get("correlation_id") or uuid.uuid4().hex
+        correlation_id = raw.get("correlation_id") or new_correlation_id()
         evidence = _parse_evidence(raw)
         adhered, reason_codes = _get_evaluator().contract.evaluate_adherence(evidence)
 
@@ -180,10 +237,10 @@ class _Handler(BaseHTTPRequestHandler):
         raw = self._read_json()
         if raw is None:
             return
-        if not self._require_fields(raw, ("task_id", "subscription_ref")):
+        if not self._require_fields(raw, _RECORD_FIELDS):
             return
 
-        correlation_id = raw.get("correlation_id") or uuid.uuid4().hex
+        correlation_id = raw.get("correlation_id") or new_correlation_id()
         client = _get_metering_client()
         newly_recorded = client.record_task_completed(
             subscription_ref=raw["subscription_ref"],
@@ -210,7 +267,7 @@ class _Handler(BaseHTTPRequestHandler):
         raw = self._read_json()
         if raw is None:
             return
-        if not self._require_fields(raw, ("task_id", "agent_id", "subscription_ref")):
+        if not self._require_fields(raw, _EVALUATION_FIELDS):
             return
 
         evidence = _parse_evidence(raw)
@@ -264,27 +321,40 @@ class _Handler(BaseHTTPRequestHandler):
 
     # --- Routing -------------------------------------------------------
 
-    _POST_ROUTES: Dict[str, str] = {
-        "/evaluate": "_handle_evaluate",
-        "/evaluate_intent_handling": "_handle_evaluate_intent_handling",
-        "/evaluate_task_adherence": "_handle_evaluate_task_adherence",
-        "/record_task_completed": "_handle_record_task_completed",
-        "/evaluate_and_meter_task": "_handle_evaluate_and_meter_task",
+    # Route tables map straight to the handler functions defined above, so
+    # dispatch is one dict lookup and a call (no getattr by name).
+    _POST_ROUTES: Dict[str, Callable[[_Handler], None]] = {
+        "/evaluate": _handle_evaluate,
+        "/evaluate_intent_handling": _handle_evaluate_intent_handling,
+        "/evaluate_task_adherence": _handle_evaluate_task_adherence,
+        "/record_task_completed": _handle_record_task_completed,
+        "/evaluate_and_meter_task": _handle_evaluate_and_meter_task,
     }
 
     def do_POST(self) -> None:  # noqa: N802
-        handler_name = self._POST_ROUTES.get(self.path)
-        if handler_name:
-            getattr(self, handler_name)()
+        handler = self._POST_ROUTES.get(self.path)
+        if handler is not None:
+            handler(self)
         else:
+            # The body was never read, so the connection cannot be reused.
+            self.close_connection = True
             self._send_json(404, {"error": "Not found"})
 
+    _GET_ROUTES: Dict[str, Callable[[_Handler], None]] = {
+        "/health": _handle_health,
+    }
+
+    # Parameterised route; the character class also rejects path traversal.
+    _AUDIT_ROUTE = re.compile(r"^/audit/([A-Za-z0-9_-]+)$")
+
     def do_GET(self) -> None:  # noqa: N802
-        if self.path == "/health":
-            self._handle_health()
-        elif self.path.startswith("/audit/"):
-            cid = self.path[len("/audit/"):]
-            self._handle_audit(cid)
+        handler = self._GET_ROUTES.get(self.path)
+        if handler is not None:
+            handler(self)
+            return
+        match = self._AUDIT_ROUTE.match(self.path)
+        if match:
+            self._handle_audit(match.group(1))
         else:
             self._send_json(404, {"error": "Not found"})
 
@@ -298,10 +368,10 @@ def create_server(
     port: int = 8080,
     config: ContractConfig | None = None,
     metering_client: MarketplaceMeteringClient | None = None,
-) -> HTTPServer:
+) -> ThreadingHTTPServer:
     """Create (but do not start) the evaluation HTTP server."""
     configure(config, metering_client=metering_client)
-    return HTTPServer((host, port), _Handler)
+    return ThreadingHTTPServer((host, port), _Handler)
 
 
 # ------------------------------------------------------------------
@@ -8,7 +8,9 @@ durable backend (database, blob storage, etc.).
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional
 
 from .models import AuditRecord
 
@@ -17,23 +19,84 @@ class AuditStore:
     """Thread-safe, in-memory audit log.
 
     Stores :class:`AuditRecord` instances keyed by ``correlation_id`` for
-    fast look-up.  Iteration order matches insertion order.
+    fast look-up.  Iteration order matches insertion order.  All access goes
+    through one lock: eviction and global insertion order span every key,
+    so per-key lock striping would not make ``record`` + eviction atomic.
+
+    Parameters
+    ----------
+    max_records : int, optional
+        Upper bound on records held in memory.  When a new record would
+        exceed it, the oldest record is passed to :meth:`spill` and then
+        dropped.  ``None`` (the default) keeps every record.
     """
 
-    def __init__(self) -> None:
-        self._records: Dict[str, AuditRecord] = {}
+    def __init__(self, max_records: Optional[int] = None) -> None:
+        if max_records is not None and max_records < 1:
+            raise ValueError("max_records must be a positive integer or None")
+        self._records: "OrderedDict[str, AuditRecord]" = OrderedDict()
+        self._max_records = max_records
+        self._lock = threading.Lock()
 
     def record(self, audit: AuditRecord) -> None:
         """Persist an audit record.  Overwrites if correlation_id exists."""
-        self._records[audit.correlation_id] = audit
+        records = self._records
+        key = audit.correlation_id
+        evicted = None
+        with self._lock:
+            if (
+                self._max_records is not None
+                and key not in records
+                and len(records) >= self._max_records
+            ):
+                _, evicted = records.popitem(last=False)
+            records[key] = audit
+        # Spill outside the lock so slow durable writes do not block readers.
+        if evicted is not None:
+            self.spill(evicted)
+
+    def record_many(self, audits: Iterable[AuditRecord]) -> None:
+        """Persist several audit records under one lock acquisition.
+
+        Same semantics as calling :meth:`record` for each, in order.
+        """
+        records = self._records
+        cap = self._max_records
+        evicted: List[AuditRecord] = []
+        with self._lock:
+            if cap is None:
+                records.update((a.correlation_id, a) for a in audits)
+            else:
+                for audit in audits:
+                    key = audit.correlation_id
+                    if key not in records and len(records) >= cap:
+                        evicted.append(records.popitem(last=False)[1])
+                    records[key] = audit
+        for audit in evicted:
+            self.spill(audit)
+
+    def spill(self, audit: AuditRecord) -> None:
+        """Hook called with each record evicted by ``max_records``.
+
+        The default discards it.  Override to flush evicted records to
+        durable storage before they leave memory.
+        """
 
     def get(self, correlation_id: str) -> Optional[AuditRecord]:
         """Retrieve a single record by its correlation ID."""
-        return self._records.get(correlation_id)
+        with self._lock:
+            return self._records.get(correlation_id)
 
     def list_records(self) -> List[AuditRecord]:
         """Return all stored records in insertion order."""
-        return list(self._records.values())
+        with self._lock:
+            return list(self._records.values())
+
+    def clear(self) -> None:
+        """Drop every stored record without spilling it."""
+        with self._lock:
+            self._records.clear()
 
     def __len__(self) -> int:
-        return len(self._records)
+        with self._lock:
+            return len(self._records)
@@ -15,16 +15,48 @@ considered *adhered* and therefore billable:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
 
+from .._compat import DATACLASS_SLOTS
 from .models import Evidence
 
 # Recognised values for the "status" output key that count as success.
 _SUCCESS_STATUSES = frozenset({"completed", "success"})
 
+# Fixed reason codes, interned once so every result shares the same objects.
+_INTENT_SKIPPED = sys.intern("intent_resolution:skipped")
+_INTENT_PASSED = sys.intern("intent_resolution:passed")
+_INTENT_FAILED = sys.intern("intent_resolution:failed")
+_TERMINAL_PASSED = sys.intern("terminal_success:passed")
+_TERMINAL_FAILED = sys.intern("terminal_success:failed")
+_REQUIRED_SKIPPED = sys.intern("required_outputs:skipped")
+_REQUIRED_PASSED = sys.intern("required_outputs:passed")
+_VALIDATION_PASSED = sys.intern("output_validation:passed")
+_APPROVAL_SKIPPED = sys.intern("approval:skipped")
+_APPROVAL_PASSED = sys.intern("approval:passed")
+_APPROVAL_FAILED = sys.intern("approval:failed")
 
-@dataclass
+# Outcomes of gates disabled by the config, reused for every evaluation.
+_INTENT_SKIP = (True, _INTENT_SKIPPED)
+_REQUIRED_SKIP = (True, _REQUIRED_SKIPPED)
+_APPROVAL_SKIP = (True, _APPROVAL_SKIPPED)
+
+
+def _skip_intent(evidence: Evidence) -> Tuple[bool, str]:
+    return _INTENT_SKIP
+
+
+def _skip_required(outputs: Dict[str, Any]) -> Tuple[bool, str]:
+    return _REQUIRED_SKIP
+
+
+def _skip_approval(outputs: Dict[str, Any]) -> Tuple[bool, str]:
+    return _APPROVAL_SKIP
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ContractConfig:
     """Configuration knobs for the adherence contract.
 
@@ -55,10 +87,34 @@ class TaskAdherenceContract:
     config : ContractConfig, optional
         Contract configuration.  Defaults to the permissive baseline
         (no required keys, no approval gate, no intent resolution gate).
+
+    Notes
+    -----
+    The gates are pure functions of the evidence and the config, so one
+    contract can be shared by concurrent callers (the REST API reuses the
+    evaluator's contract for every request).  Treat *config* as immutable
+    once the contract has been built: the optional-gate switches and the
+    required keys are read once, at construction, to pick the gate
+    functions.
     """
 
     def __init__(self, config: ContractConfig | None = None) -> None:
         self._config = config or ContractConfig()
+        config = self._config
+        self._intent_threshold = config.intent_resolution_threshold
+        self._intent_gate = (
+            self._gate_intent_resolution
+            if config.require_intent_resolution
+            else _skip_intent
+        )
+        self._required_keys = tuple(config.required_output_keys)
+        self._required_set = frozenset(self._required_keys)
+        self._required_gate = (
+            self._gate_required_outputs if self._required_keys else _skip_required
+        )
+        self._approval_gate = (
+            self._gate_approval if config.require_approval else _skip_approval
+        )
 
     # ------------------------------------------------------------------
     # Individual gates
@@ -73,47 +129,44 @@ class TaskAdherenceContract:
         * ``evidence.outputs["intent_handled"]`` is truthy
         * Both ``evidence.query`` and ``evidence.response`` are non-empty
         """
-        if not self._config.require_intent_resolution:
-            return True, "intent_resolution:skipped"
-
         # Score from Azure AI Evaluation SDK
         score = evidence.scores.get("intent_resolution")
         if score is not None:
-            if score >= self._config.intent_resolution_threshold:
-                return True, "intent_resolution:passed"
+            if score >= self._intent_threshold:
+                return True, _INTENT_PASSED
             return False, f"intent_resolution:score_below_threshold={score}"
 
         # Explicit flag
         if evidence.outputs.get("intent_handled"):
-            return True, "intent_resolution:passed"
+            return True, _INTENT_PASSED
 
         # Query + response presence
         if evidence.query and evidence.response:
-            return True, "intent_resolution:passed"
+            return True, _INTENT_PASSED
 
-        return False, "intent_resolution:failed"
+        return False, _INTENT_FAILED
 
     @staticmethod
     def _gate_terminal_success(outputs: Dict[str, Any]) -> Tuple[bool, str]:
-        """Gate 1 — evidence must signal terminal success."""
-        if outputs.get("terminal_success"):
-            return True, "terminal_success:passed"
+        """Gate 1 — evidence must signal terminal success.
 
-        status = outputs.get("status", "")
+        Passes on a truthy ``outputs["terminal_success"]`` or a
+        ``"completed"`` / ``"success"`` status (case-insensitive).
+        """
+        if outputs.get("terminal_success"):
+            return True, _TERMINAL_PASSED
+        status = outputs.get("status")
         if isinstance(status, str) and status.lower() in _SUCCESS_STATUSES:
-            return True, "terminal_success:passed"
-
-        return False, "terminal_success:failed"
+            return True, _TERMINAL_PASSED
+        return False, _TERMINAL_FAILED
 
     def _gate_required_outputs(self, outputs: Dict[str, Any]) -> Tuple[bool, str]:
         """Gate 2 — all configured required output keys must be present."""
-        if not self._config.required_output_keys:
-            return True, "required_outputs:skipped"
-
-        missing = [k for k in self._config.required_output_keys if k not in outputs]
-        if missing:
-            return False, f"required_outputs:missing={','.join(missing)}"
-        return True, "required_outputs:passed"
+        if outputs.keys() >= self._required_set:
+            return True, _REQUIRED_PASSED
+        # Only the failure path builds the (ordered) list of missing keys.
+        missing = [k for k in self._required_keys if k not in outputs]
+        return False, f"required_outputs:missing={','.join(missing)}"
 
     @staticmethod
     def _gate_output_validation(outputs: Dict[str, Any]) -> Tuple[bool, str]:
@@ -126,46 +179,48 @@ class TaskAdherenceContract:
                 invalid.append(key)
         if invalid:
             return False, f"output_validation:invalid={','.join(invalid)}"
-        return True, "output_validation:passed"
+        return True, _VALIDATION_PASSED
 
     def _gate_approval(self, outputs: Dict[str, Any]) -> Tuple[bool, str]:
         """Gate 4 (optional) — explicit approval flag must be truthy."""
-        if not self._config.require_approval:
-            return True, "approval:skipped"
-
         if outputs.get("approved"):
-            return True, "approval:passed"
-        return False, "approval:failed"
+            return True, _APPROVAL_PASSED
+        return False, _APPROVAL_FAILED
+
+    # ------------------------------------------------------------------
+    # Gate pipeline
+    # ------------------------------------------------------------------
+
+    def _adherence(self, evidence: Evidence) -> Tuple[bool, Tuple[str, ...]]:
+        """Run gates 1-4 and return ``(adhered, reason_codes)``."""
+        outputs = evidence.outputs
+        ts_ok, ts_code = self._gate_terminal_success(outputs)
+        req_ok, req_code = self._required_gate(outputs)
+        val_ok, val_code = self._gate_output_validation(outputs)
+        appr_ok, appr_code = self._approval_gate(outputs)
+        return (
+            ts_ok & req_ok & val_ok & appr_ok,
+            (ts_code, req_code, val_code, appr_code),
+        )
 
     # ------------------------------------------------------------------
     # Public evaluation entry-point
     # ------------------------------------------------------------------
 
-    def evaluate(self, evidence: Evidence) -> Tuple[bool, bool, List[str]]:
+    def evaluate(self, evidence: Evidence) -> Tuple[bool, bool, Tuple[str, ...]]:
         """Run all gates against *evidence*.
 
         Returns
         -------
-        tuple[bool, bool, list[str]]
+        tuple[bool, bool, tuple[str, ...]]
             ``(intent_handled, adhered, reason_codes)`` where
             *intent_handled* reflects gate 0 and *adhered* reflects
             gates 1-4.  All gates execute regardless of earlier failures
             so that every reason code is collected for audit purposes.
         """
-        intent_gate = self._gate_intent_resolution(evidence)
-
-        outputs = evidence.outputs
-        adherence_gates = [
-            self._gate_terminal_success(outputs),
-            self._gate_required_outputs(outputs),
-            self._gate_output_validation(outputs),
-            self._gate_approval(outputs),
-        ]
-
-        intent_handled = intent_gate[0]
-        adhered = all(passed for passed, _ in adherence_gates)
-        reason_codes = [intent_gate[1]] + [code for _, code in adherence_gates]
-        return intent_handled, adhered, reason_codes
+        intent_handled, intent_code = self._intent_gate(evidence)
+        adhered, codes = self._adherence(evidence)
+        return intent_handled, adhered, (intent_code, *codes)
 
     def evaluate_intent(self, evidence: Evidence) -> Tuple[bool, str]:
         """Evaluate only the intent resolution gate (Gate 0).
@@ -175,23 +230,14 @@ class TaskAdherenceContract:
         tuple[bool, str]
             ``(intent_handled, reason)``
         """
-        return self._gate_intent_resolution(evidence)
+        return self._intent_gate(evidence)
 
-    def evaluate_adherence(self, evidence: Evidence) -> Tuple[bool, List[str]]:
+    def evaluate_adherence(self, evidence: Evidence) -> Tuple[bool, Tuple[str, ...]]:
         """Evaluate only the task adherence gates (Gates 1-4).
 
         Returns
         -------
-        tuple[bool, list[str]]
+        tuple[bool, tuple[str, ...]]
             ``(adhered, reason_codes)``
         """
-        outputs = evidence.outputs
-        gates = [
-            self._gate_terminal_success(outputs),
-            self._gate_required_outputs(outputs),
-            self._gate_output_validation(outputs),
-            self._gate_approval(outputs),
-        ]
-        adhered = all(passed for passed, _ in gates)
-        reason_codes = [code for _, code in gates]
-        return adhered, reason_codes
+        return self._adherence(evidence)
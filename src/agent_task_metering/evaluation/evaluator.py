@@ -7,9 +7,14 @@ correlation ID, emits an audit record, and returns a deterministic
 
 from __future__ import annotations
 
-import uuid
-from dataclasses import asdict
+import atexit
+import queue
+import sys
+import threading
+import traceback
+from typing import Callable, Iterable, List, Optional, Tuple
 
+from .._ids import new_correlation_id, new_correlation_ids
 from ..audit_logger import get_audit_logger
 from .audit import AuditStore
 from .contract import ContractConfig, TaskAdherenceContract
@@ -18,6 +23,82 @@ from .models import AuditRecord, EvaluationRequest, EvaluationResult
 _log = get_audit_logger()
 
 
+def _intern(value: str) -> str:
+    # Request IDs come from untrusted JSON and may not be str.
+    return sys.intern(value) if type(value) is str else value
+
+
+# ---------------------------------------------------------------------------
+# Deferred decision logging
+# ---------------------------------------------------------------------------
+
+# (correlation_id, task_id, agent_id, subscription_ref,
+#  intent_handled, adhered, billable_units, reason_codes)
+_Decision = Tuple[str, str, str, str, bool, bool, int, Tuple[str, ...]]
+
+_decision_queue: "queue.Queue[_Decision]" = queue.Queue()
+_drainer: Optional[threading.Thread] = None
+_drainer_lock = threading.Lock()
+
+
+def _log_decision(
+    correlation_id: str,
+    task_id: str,
+    agent_id: str,
+    subscription_ref: str,
+    intent_handled: bool,
+    adhered: bool,
+    billable_units: int,
+    reason_codes: Tuple[str, ...],
+) -> None:
+    _log.log_event(
+        "evaluation_decision",
+        correlation_id=correlation_id,
+        task_id=task_id,
+        agent_id=agent_id,
+        subscription_ref=subscription_ref,
+        intent_handled=intent_handled,
+        adhered=adhered,
+        billable_units=billable_units,
+        reason_codes=reason_codes,
+    )
+
+
+def _drain_decisions() -> None:
+    get = _decision_queue.get
+    while True:
+        decision = get()
+        try:
+            _log_decision(*decision)
+        except Exception:  # noqa: BLE001 — one bad decision must not stop the drainer
+            traceback.print_exc()
+        finally:
+            _decision_queue.task_done()
+
+
+def _defer_decision(decision: _Decision) -> None:
+    global _drainer
+    if _drainer is None:
+        with _drainer_lock:
+            if _drainer is None:
+                thread = threading.Thread(
+                    target=_drain_decisions, name="evaluation-decision-log", daemon=True
+                )
+                thread.start()
+                _drainer = thread
+    _decision_queue.put(decision)
+
+
+def flush_decision_log() -> None:
+    """Block until every deferred ``evaluation_decision`` event has been logged."""
+    # A dead drainer would never finish the queue, so joining would hang.
+    if _drainer is not None and _drainer.is_alive():
+        _decision_queue.join()
+
+
+atexit.register(flush_decision_log)
+
+
 class TaskAdherenceEvaluator:
     """Evaluate a task against the adherence contract and produce a billable outcome.
 
@@ -28,15 +109,37 @@ class TaskAdherenceEvaluator:
     audit_store : AuditStore, optional
         Where to persist audit records.  A fresh in-memory store is created
         when none is supplied.
+    defer_logging : bool
+        When *True*, ``evaluation_decision`` events are handed to a
+        background thread instead of being logged inline, keeping log
+        formatting and I/O off the caller's path.  Such events may appear
+        after events logged later on the calling thread; call
+        :func:`flush_decision_log` to wait for them (also run at exit).
+        Audit records are still stored synchronously.
+    persist_audit : bool
+        When *False*, no :class:`AuditRecord` is built or stored (e.g. for
+        backfills that only need billability).  The decision is still
+        logged.
+    audit_sampler : callable, optional
+        ``audit_sampler(request) -> bool`` deciding per request whether to
+        store an audit record (e.g. 1-in-N sampling).  Ignored when
+        *persist_audit* is *False*.  Unsampled evaluations return a full
+        result but cannot be looked up by ``correlation_id``.
     """
 
     def __init__(
         self,
         config: ContractConfig | None = None,
         audit_store: AuditStore | None = None,
+        defer_logging: bool = False,
+        persist_audit: bool = True,
+        audit_sampler: Optional[Callable[[EvaluationRequest], bool]] = None,
     ) -> None:
         self._contract = TaskAdherenceContract(config)
         self._audit_store = audit_store if audit_store is not None else AuditStore()
+        self._emit_decision = _defer_decision if defer_logging else None
+        self._persist_audit = persist_audit
+        self._audit_sampler = audit_sampler
 
     # ------------------------------------------------------------------
     # Core evaluation
@@ -48,14 +151,56 @@ class TaskAdherenceEvaluator:
         The method is **deterministic**: the same inputs always produce
         the same ``intent_handled`` / ``adhered`` / ``billable_units``
         outcome.  A unique ``correlation_id`` is generated for each
-        invocation and an :class:`AuditRecord` is persisted automatically.
+        invocation and an :class:`AuditRecord` is persisted automatically
+        (unless disabled or sampled out, see the constructor).
 
         Billing requires **both** intent resolution and task adherence
         gates to pass: ``billable_units = 1`` only when
         ``intent_handled and adhered``.
         """
-        correlation_id = uuid.uuid4().hex
+        result, decision, audit = self._decide(request, new_correlation_id())
+        if audit is not None:
+            self._audit_store.record(audit)
+        self._emit(decision)
+        return result
+
+    def evaluate_many(
+        self, requests: Iterable[EvaluationRequest]
+    ) -> List[EvaluationResult]:
+        """Evaluate a batch of requests (bulk scoring / traffic replay).
 
+        Equivalent to calling :meth:`evaluate` on each request in order,
+        except that correlation IDs are drawn in one batch and the audit
+        records are persisted with a single :meth:`AuditStore.record_many`
+        call after every request has been decided.  One
+        ``evaluation_decision`` event is still logged per request, once the
+        audit records are stored, so a request that raises part-way through
+        leaves neither decisions nor audits for the batch.
+        """
+        requests = list(requests)
+        results: List[EvaluationResult] = []
+        decisions: List[_Decision] = []
+        audits: List[AuditRecord] = []
+        decide = self._decide
+        for request, correlation_id in zip(
+            requests, new_correlation_ids(len(requests))
+        ):
+            result, decision, audit = decide(request, correlation_id)
+            results.append(result)
+            decisions.append(decision)
+            if audit is not None:
+                audits.append(audit)
+        if audits:
+            self._audit_store.record_many(audits)
+        emit = self._emit
+        for decision in decisions:
+            emit(decision)
+        return results
+
+    def _decide(
+        self, request: EvaluationRequest, correlation_id: str
+    ) -> Tuple[EvaluationResult, _Decision, Optional[AuditRecord]]:
+        """Run the gates and build (not log or store) the decision and audit record."""
         intent_handled, adhered, reason_codes = self._contract.evaluate(
             request.evidence
         )
@@ -69,33 +214,42 @@ class TaskAdherenceEvaluator:
             correlation_id=correlation_id,
         )
 
-        _log.log_event(
-            "evaluation_decision",
-            correlation_id=correlation_id,
-            task_id=request.task_id,
-            agent_id=request.agent_id,
-            subscription_ref=request.subscription_ref,
-            intent_handled=intent_handled,
-            adhered=adhered,
-            billable_units=billable_units,
-            reason_codes=reason_codes,
+        decision = (
+            correlation_id,
+            request.task_id,
+            request.agent_id,
+            request.subscription_ref,
+            intent_handled,
+            adhered,
+            billable_units,
+            reason_codes,
         )
 
-        # Persist audit trail
+        if not self._persist_audit or (
+            self._audit_sampler is not None and not self._audit_sampler(request)
+        ):
+            return result, decision, None
+
+        # Audit trail.  Agent and subscription IDs repeat across
+        # many retained records, so intern them.
         audit = AuditRecord(
             correlation_id=correlation_id,
             task_id=request.task_id,
-            agent_id=request.agent_id,
-            subscription_ref=request.subscription_ref,
-            evidence=asdict(request.evidence),
+            agent_id=_intern(request.agent_id),
+            subscription_ref=_intern(request.subscription_ref),
+            evidence=request.evidence.as_shallow_dict(),
             intent_handled=intent_handled,
             adhered=adhered,
             billable_units=billable_units,
             reason_codes=reason_codes,
         )
-        self._audit_store.record(audit)
+        return result, decision, audit
 
-        return result
+    def _emit(self, decision: _Decision) -> None:
+        if self._emit_decision is not None:
+            self._emit_decision(decision)
+        else:
+            _log_decision(*decision)
 
     # ------------------------------------------------------------------
     # Introspection helpers
@@ -103,7 +257,7 @@ class TaskAdherenceEvaluator:
 
     @property
     def contract(self) -> TaskAdherenceContract:
-        """Access the underlying adherence contract."""
+        """Access the underlying adherence contract (shared, do not reconfigure)."""
         return self._contract
 
     @property
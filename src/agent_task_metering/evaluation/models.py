@@ -1,14 +1,21 @@
 """Data models for task adherence evaluation."""
 
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
 
+from .._compat import DATACLASS_SLOTS
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Evidence:
     """Evidence payload for task adherence evaluation.
 
+    The containers are the caller's dicts/lists and are not copied.
+
     Parameters
     ----------
     outputs : dict
@@ -29,8 +36,24 @@ class Evidence:
     query: Optional[str] = None
     response: Optional[str] = None
 
+    def as_shallow_dict(self) -> Dict[str, Any]:
+        """Return the evidence as a plain dict, copying only the top level.
+
+        ``outputs``, ``traces`` and ``scores`` are fresh containers, so later
+        additions or removals by the caller do not show up in the result,
+        but nested values (e.g. individual trace dicts) are shared.  Much
+        cheaper than a recursive :func:`dataclasses.asdict` for large traces.
+        """
+        return {
+            "outputs": dict(self.outputs),
+            "traces": list(self.traces),
+            "scores": dict(self.scores),
+            "query": self.query,
+            "response": self.response,
+        }
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EvaluationRequest:
     """Input to the task adherence evaluation endpoint.
 
@@ -52,7 +75,7 @@ class EvaluationRequest:
     evidence: Evidence = field(default_factory=Evidence)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EvaluationResult:
     """Output of the task adherence evaluation.
 
@@ -64,7 +87,7 @@ class EvaluationResult:
         Whether the task met all adherence contract gates.
     billable_units : int
         ``1`` when both *intent_handled* and *adhered*, ``0`` otherwise.
-    reason_codes : list[str]
+    reason_codes : tuple[str, ...]
         Human-readable codes describing each gate outcome.
     correlation_id : str
         Unique identifier for this evaluation (for audit trail).
@@ -73,19 +96,28 @@ class EvaluationResult:
     intent_handled: bool
     adhered: bool
     billable_units: int
-    reason_codes: List[str]
+    reason_codes: Tuple[str, ...]
     correlation_id: str
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "intent_handled": self.intent_handled,
+            "adhered": self.adhered,
+            "billable_units": self.billable_units,
+            "reason_codes": self.reason_codes,
+            "correlation_id": self.correlation_id,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AuditRecord:
     """Immutable audit entry persisted for every evaluation decision.
 
     Combines the full request context with the evaluation result so that
-    any billing decision can be reconstructed later.
+    any billing decision can be reconstructed later.  ``timestamp`` is the
+    creation time in integer nanoseconds since the Unix epoch (from
+    :func:`time.time_ns`); :meth:`to_dict` renders it as an ISO-8601 UTC
+    string.
     """
 
     correlation_id: str
@@ -96,11 +128,28 @@ class AuditRecord:
     intent_handled: bool
     adhered: bool
     billable_units: int
-    reason_codes: List[str]
-    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    reason_codes: Tuple[str, ...]
+    timestamp: int = field(default_factory=time.time_ns)
     metadata: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
-        d["timestamp"] = self.timestamp.isoformat()
-        return d
+        """Return a JSON-ready dict.
+
+        ``evidence`` and ``metadata`` are the record's own containers, not
+        copies; serialize the result rather than mutating it.
+        """
+        return {
+            "correlation_id": self.correlation_id,
+            "task_id": self.task_id,
+            "agent_id": self.agent_id,
+            "subscription_ref": self.subscription_ref,
+            "evidence": self.evidence,
+            "intent_handled": self.intent_handled,
+            "adhered": self.adhered,
+            "billable_units": self.billable_units,
+            "reason_codes": self.reason_codes,
+            "timestamp": (
+                _EPOCH + timedelta(microseconds=self.timestamp // 1000)
+            ).isoformat(),
+            "metadata": self.metadata,
+        }
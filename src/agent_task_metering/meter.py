@@ -1,16 +1,28 @@
 """TaskMeter: records and aggregates agent task metrics."""
 
+import sys
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from .models import TaskRecord
 
 
 class TaskMeter:
-    """Collects and aggregates metering data for agent tasks."""
+    """Collects and aggregates metering data for agent tasks.
+
+    Token totals are accumulated as tasks are recorded, so they reflect the
+    token counts passed to :meth:`record` (later edits to a returned
+    :class:`TaskRecord` are not re-summed).
+    """
 
     def __init__(self) -> None:
         self._records: List[TaskRecord] = []
+        # agent_id -> records, maintained incrementally by record()
+        self._by_agent: Dict[str, List[TaskRecord]] = {}
+        # running token totals, overall and per agent
+        self._total_tokens = 0
+        self._tokens_by_agent: Counter[str] = Counter()
 
     def record(
         self,
@@ -23,11 +35,18 @@ class TaskMeter:
         end_time: Optional[datetime] = None,
         metadata: Optional[Dict] = None,
     ) -> TaskRecord:
-        """Record a completed (or in-progress) agent task."""
+        """Record a completed (or in-progress) agent task.
+
+        *task_id*, *agent_id* and *task_type* must be plain ``str``; they are
+        interned so repeated values share one object across records and the
+        agent index.
+        """
+        task_id = sys.intern(task_id)
+        agent_id = sys.intern(agent_id)
         record = TaskRecord(
             task_id=task_id,
             agent_id=agent_id,
-            task_type=task_type,
+            task_type=sys.intern(task_type),
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             metadata=metadata or {},
@@ -37,20 +56,61 @@ class TaskMeter:
         if end_time is not None:
             record.end_time = end_time
         self._records.append(record)
+        self._by_agent.setdefault(agent_id, []).append(record)
+        tokens = input_tokens + output_tokens
+        self._total_tokens += tokens
+        self._tokens_by_agent[agent_id] += tokens
         return record
 
+    def record_many(self, batch: Iterable[Sequence[Any]]) -> List[TaskRecord]:
+        """Record many tasks in one call (bulk ingest / log replay).
+
+        Each item is ``(task_id, agent_id, task_type, input_tokens,
+        output_tokens)``.  A NumPy structured array with fields in that order
+        is accepted as well (it is read through ``tolist()``; NumPy itself is
+        not required).  Attribute lookups are hoisted out of the loop.
+        """
+        if hasattr(batch, "dtype"):
+            batch = batch.tolist()  # type: ignore[union-attr]
+
+        intern = sys.intern
+        append = self._records.append
+        by_agent = self._by_agent
+        tokens_by_agent = self._tokens_by_agent
+        added: List[TaskRecord] = []
+        for task_id, agent_id, task_type, input_tokens, output_tokens in batch:
+            agent_id = intern(agent_id)
+            record = TaskRecord(
+                task_id=intern(task_id),
+                agent_id=agent_id,
+                task_type=intern(task_type),
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+            )
+            append(record)
+            added.append(record)
+            bucket = by_agent.get(agent_id)
+            if bucket is None:
+                bucket = by_agent[agent_id] = []
+            bucket.append(record)
+            tokens = input_tokens + output_tokens
+            tokens_by_agent[agent_id] += tokens
+            self._total_tokens += tokens
+        return added
+
     def total_tokens(self) -> int:
         """Return the sum of all tokens across all recorded tasks."""
-        return sum(r.total_tokens for r in self._records)
+        return self._total_tokens
 
     def records_for_agent(self, agent_id: str) -> List[TaskRecord]:
         """Return all records for a given agent."""
-        return [r for r in self._records if r.agent_id == agent_id]
+        return list(self._by_agent.get(agent_id, ()))
 
     def summary(self) -> Dict:
         """Return a high-level summary of all metered tasks."""
         return {
             "total_tasks": len(self._records),
-            "total_tokens": self.total_tokens(),
-            "agents": list({r.agent_id for r in self._records}),
+            "total_tokens": self._total_tokens,
+            "agents": list(self._by_agent),
+            "tokens_by_agent": dict(self._tokens_by_agent),
         }
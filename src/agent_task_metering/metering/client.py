@@ -8,23 +8,91 @@ Key Marketplace constraints enforced:
 - Only one usage event per hour per dimension per resource
 - Aggregate quantity within the hour
 - Dimension is exactly ``task_completed``
+- Batch submissions carry at most 25 events and stay under 1 MB
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import sys
+import threading
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .. import _json
+from .._compat import DATACLASS_SLOTS
+from ..audit_logger import AsyncAuditSink, get_audit_logger
+
+DIMENSION = sys.intern("task_completed")
+
+# Marketplace ``batchUsageEvent`` limits: records per call and request size.
+_BATCH_MAX = 25
+_PAYLOAD_MAX = 1_000_000
+
+# Lock stripes for per-subscription state (power of two).
+_STRIPES = 32
+
+# How ``task_recorded`` events are emitted (see MarketplaceMeteringClient).
+_AUDIT_MODES = frozenset({"sync", "batched", "none"})
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_HOUR = timedelta(hours=1)
 
-from ..audit_logger import get_audit_logger
+_log = get_audit_logger()
 
-DIMENSION = "task_completed"
 
-_log = get_audit_logger()
+def _intern(value: str) -> str:
+    # IDs can arrive from untrusted JSON and may not be str.
+    return sys.intern(value) if type(value) is str else value
+
+
+def _hour_bucket(ts: datetime) -> int:
+    """Return whole hours since the Unix epoch for *ts* (naive means UTC)."""
+    # Aware minus aware subtracts UTC offsets itself; no astimezone() copy.
+    return (ts - (_NAIVE_EPOCH if ts.tzinfo is None else _EPOCH)) // _HOUR
+
+
+@lru_cache(maxsize=1024)
+def _bucket_to_iso(bucket: int) -> str:
+    """Return the ISO-8601 hour string (e.g. ``2025-06-01T14:00:00Z``) for *bucket*.
+
+    Memoized: recording formats the same hour for every event in it.
+    """
+    return (_EPOCH + bucket * _HOUR).strftime("%Y-%m-%dT%H:00:00Z")
+
 
+@lru_cache(maxsize=4096)
+def _iso_to_bucket(hour_iso: str) -> Optional[int]:
+    """Parse an ISO-8601 hour string into its hour bucket (memoized).
+
+    Returns ``None`` for input that is not a timestamp or does not fall on
+    a whole UTC hour, so it matches no window.
+    """
+    try:
+        ts = datetime.fromisoformat(hour_iso.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    bucket, rest = divmod(ts - (_NAIVE_EPOCH if ts.tzinfo is None else _EPOCH), _HOUR)
+    return None if rest else bucket
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class UsageEvent:
     """Azure Marketplace usage event payload (single dimension)."""
 
@@ -35,10 +103,20 @@ class UsageEvent:
     planId: str = ""
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "resourceId": self.resourceId,
+            "quantity": self.quantity,
+            "dimension": self.dimension,
+            "effectiveStartTime": self.effectiveStartTime,
+            "planId": self.planId,
+        }
+
+
+# ((subscription_ref, hour_bucket), event) awaiting submission.
+_Pending = Tuple[Tuple[str, int], UsageEvent]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnomalyRecord:
     """Recorded when a guardrail cap is exceeded for a subscription."""
 
@@ -51,12 +129,18 @@ class AnomalyRecord:
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def to_dict(self) -> Dict[str, Any]:
-        d = asdict(self)
-        d["timestamp"] = self.timestamp.isoformat()
-        return d
-
-
-@dataclass
+        return {
+            "subscription_ref": self.subscription_ref,
+            "cap_type": self.cap_type,
+            "cap_value": self.cap_value,
+            "actual_value": self.actual_value,
+            "task_id": self.task_id,
+            "correlation_id": self.correlation_id,
+            "timestamp": self.timestamp.isoformat(),
+        }
+
+
+@dataclass(**DATACLASS_SLOTS)
 class GuardrailConfig:
     """Configurable caps for per-subscription metering guardrails.
 
@@ -68,10 +152,16 @@ class GuardrailConfig:
     daily_cap : int
         Maximum ``task_completed`` events per subscription per day.
         ``0`` means unlimited.
+    retention_hours : int
+        Hours of history kept behind the newest hour recorded for each
+        subscription.  Completions older than that are rejected as late;
+        submitted windows older than that are freed by
+        :meth:`aggregate_and_submit`.  ``0`` means keep everything.
     """
 
     hourly_cap: int = 0
     daily_cap: int = 0
+    retention_hours: int = 0
 
 
 class MarketplaceMeteringClient:
@@ -81,13 +171,32 @@ class MarketplaceMeteringClient:
     ----------
     dry_run : bool
         When *True* (default), events are printed instead of submitted.
+    dry_run_pretty : bool
+        Print dry-run events as indented JSON instead of one
+        ``key=value`` line each.
+    print_fn : callable
+        ``f(line) -> None`` that receives each dry-run output line.
+        Defaults to :func:`print`.
     submit_callback : callable, optional
         ``f(event_dict) -> None`` called for each aggregated event when
         *dry_run* is False.  Plug in real Marketplace API calls here.
+    batch_submit_callback : callable, optional
+        ``f(list_of_event_dicts) -> None`` called once per batch of up to
+        25 events (and under 1 MB encoded) when *dry_run* is False.  Plug
+        in the Marketplace ``batchUsageEvent`` call here.  Takes precedence
+        over *submit_callback*.
+    batch_size : int
+        Events per *batch_submit_callback* call, ``1``-``25`` (the
+        Marketplace maximum, and the default).
     plan_id : str
         Marketplace plan ID attached to every usage event.
     guardrail_config : GuardrailConfig, optional
         Per-subscription hourly/daily caps.
+    audit_mode : {"sync", "batched", "none"}
+        How the per-task ``task_recorded`` event is emitted: inline
+        (default), through a background :class:`AsyncAuditSink` (flushed
+        before each aggregation), or not at all.  Duplicate, guardrail and
+        submission events are always logged synchronously.
     """
 
     def __init__(
@@ -96,48 +205,85 @@ class MarketplaceMeteringClient:
         submit_callback: Optional[Callable[[Dict], None]] = None,
         plan_id: str = "",
         guardrail_config: Optional[GuardrailConfig] = None,
+        batch_submit_callback: Optional[Callable[[List[Dict]], None]] = None,
+        audit_mode: str = "sync",
+        batch_size: int = _BATCH_MAX,
+        dry_run_pretty: bool = False,
+        print_fn: Callable[[str], None] = print,
     ) -> None:
+        if not 1 <= batch_size <= _BATCH_MAX:
+            raise ValueError(f"batch_size must be between 1 and {_BATCH_MAX}")
+        if audit_mode not in _AUDIT_MODES:
+            raise ValueError(
+                f"audit_mode must be one of {sorted(_AUDIT_MODES)}, got {audit_mode!r}"
+            )
         self._dry_run = dry_run
+        self._dry_run_pretty = dry_run_pretty
+        self._print_fn = print_fn
         self._submit_callback = submit_callback
-        self._plan_id = plan_id
+        self._batch_submit_callback = batch_submit_callback
+        self._batch_size = batch_size
+        self._plan_id = sys.intern(plan_id)
         self._guardrail = guardrail_config or GuardrailConfig()
-        # {(subscription_ref, hour_key): set_of_task_ids}
-        self._completions: Dict[Tuple[str, str], Set[str]] = {}
+        self._audit_mode = audit_mode
+        self._sink = AsyncAuditSink(_log) if audit_mode == "batched" else None
+        # Windows are keyed by integer hour bucket (hours since the epoch);
+        # the ISO string form is only built for events and logs.
+        # {(subscription_ref, hour_bucket): set_of_task_ids} — O(1) dedup
+        self._completions: Dict[Tuple[str, int], Set[str]] = {}
+        # {(subscription_ref, hour_bucket): quantity} — kept in step with the
+        # sets above so aggregation never rescans recorded task IDs
+        self._quantities: Counter[Tuple[str, int]] = Counter()
+        # {(subscription_ref, day): quantity} where day = hour_bucket // 24,
+        # so the daily cap is one lookup instead of a scan over every hour
+        self._daily_quantities: Counter[Tuple[str, int]] = Counter()
+        # {hour_bucket: {subscription_ref: None}} — an insertion-ordered set
+        # of the subscriptions recorded per hour, so aggregating one window
+        # never scans every bucket
+        self._by_hour: DefaultDict[int, Dict[str, None]] = defaultdict(dict)
         # track submitted hour windows for idempotency
-        self._submitted: Set[Tuple[str, str]] = set()
+        self._submitted: Set[Tuple[str, int]] = set()
+        # windows recorded but not yet submitted, in recording order (a dict
+        # used as an ordered set), so aggregation skips submitted history
+        self._pending: Dict[Tuple[str, int], None] = {}
         # anomaly records created when caps are breached
         self._anomalies: List[AnomalyRecord] = []
+        # {subscription_ref: newest hour bucket recorded} — the retention
+        # horizon is per subscription, so one tenant's clock skew cannot
+        # push another tenant's completions out of the window
+        self._newest_bucket: Dict[str, int] = {}
+        # Locking: a subscription's entries in the dicts above are only
+        # read or written under its stripe lock, so a recording only takes
+        # its subscription's stripe.  The dicts themselves are shared by all
+        # stripes; inserting and deleting different keys concurrently relies
+        # on single dict operations being atomic (the GIL, or the per-object
+        # locks of free-threaded builds).  The cross-subscription indexes
+        # _by_hour, _pending and _submitted are iterated as well as mutated,
+        # so they are guarded by _index_lock (taken after a stripe, never
+        # before).  Submission is serialized so a window cannot be sent
+        # twice by concurrent callers.
+        self._stripe_locks = [threading.Lock() for _ in range(_STRIPES)]
+        self._index_lock = threading.Lock()
+        self._submit_lock = threading.Lock()
+
+    def _stripe_lock(self, subscription_ref: str) -> threading.Lock:
+        return self._stripe_locks[hash(subscription_ref) & (_STRIPES - 1)]
 
     # ------------------------------------------------------------------
     # Cap helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _day_key(ts: datetime) -> str:
-        """Return the ISO-8601 day bucket for *ts* (UTC, truncated to day)."""
-        utc = ts.astimezone(timezone.utc) if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
-        return utc.strftime("%Y-%m-%d")
+    def _hourly_count(self, subscription_ref: str, bucket: int) -> int:
+        return self._quantities[(subscription_ref, bucket)]
 
-    def _hourly_count(self, subscription_ref: str, hour_key: str) -> int:
-        return len(self._completions.get((subscription_ref, hour_key), set()))
-
-    def _daily_count(self, subscription_ref: str, day_key: str) -> int:
-        total = 0
-        for (sub, hk), tasks in self._completions.items():
-            if sub == subscription_ref and hk.startswith(day_key):
-                total += len(tasks)
-        return total
+    def _daily_count(self, subscription_ref: str, day: int) -> int:
+        """Quantity recorded for *subscription_ref* on *day* (``bucket // 24``)."""
+        return self._daily_quantities[(subscription_ref, day)]
 
     # ------------------------------------------------------------------
     # Recording
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _hour_key(ts: datetime) -> str:
-        """Return the ISO-8601 hour bucket for *ts* (UTC, truncated to hour)."""
-        utc = ts.astimezone(timezone.utc) if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
-        return utc.strftime("%Y-%m-%dT%H:00:00Z")
-
     def record_task_completed(
         self,
         subscription_ref: str,
@@ -148,19 +294,66 @@ class MarketplaceMeteringClient:
         """Record a single ``task_completed`` event.
 
         Returns *True* if the task was newly recorded, *False* if it was
-        a duplicate within the same hour (idempotent) **or** if a
-        guardrail cap was exceeded.
+        a duplicate within the same hour (idempotent), if a guardrail cap
+        was exceeded, **or** if it is older than the retention window.
+
+        ``str`` values of *subscription_ref* and *task_id* are interned
+        before being used as dict/set keys.  Safe to call from
+        several threads; calls for the same subscription are serialized.
         """
+        subscription_ref = _intern(subscription_ref)
+        task_id = _intern(task_id)
         cid = correlation_id or ""
         ts = timestamp or datetime.now(timezone.utc)
-        hk = self._hour_key(ts)
-        dk = self._day_key(ts)
-        key = (subscription_ref, hk)
+        with self._stripe_lock(subscription_ref):
+            return self._record(subscription_ref, task_id, ts, cid)
 
-        if key not in self._completions:
-            self._completions[key] = set()
+    def record_many(
+        self,
+        subscription_ref: str,
+        task_ids: Iterable[str],
+        timestamp: Optional[datetime] = None,
+        correlation_id: Optional[str] = None,
+    ) -> List[bool]:
+        """Record several completions for one subscription at *timestamp*.
 
-        if task_id in self._completions[key]:
+        Equivalent to calling :meth:`record_task_completed` once per task
+        ID, in order, but takes the subscription's lock only once.
+        Returns one flag per task ID with the same meaning.
+        """
+        subscription_ref = _intern(subscription_ref)
+        cid = correlation_id or ""
+        ts = timestamp or datetime.now(timezone.utc)
+        record = self._record
+        with self._stripe_lock(subscription_ref):
+            return [record(subscription_ref, _intern(t), ts, cid) for t in task_ids]
+
+    def _record(
+        self, subscription_ref: str, task_id: str, ts: datetime, cid: str
+    ) -> bool:
+        """Dedup, cap-check and count one completion (stripe lock held)."""
+        bucket = _hour_bucket(ts)
+        hk = _bucket_to_iso(bucket)
+        key = (subscription_ref, bucket)
+
+        retention = self._guardrail.retention_hours
+        if retention > 0:
+            newest = self._newest_bucket.get(subscription_ref)
+            if newest is None or bucket > newest:
+                self._newest_bucket[subscription_ref] = bucket
+            elif bucket <= newest - retention:
+                _log.log_event(
+                    "task_recording_late",
+                    correlation_id=cid,
+                    subscription_ref=subscription_ref,
+                    task_id=task_id,
+                    hour_key=hk,
+                    retention_hours=retention,
+                )
+                return False  # window may already be submitted and freed
+
+        seen = self._completions.get(key)
+        if seen is not None and task_id in seen:
             _log.log_event(
                 "task_recording_duplicate",
                 correlation_id=cid,
@@ -172,7 +365,7 @@ class MarketplaceMeteringClient:
 
         # --- Guardrail: hourly cap ---
         if self._guardrail.hourly_cap > 0:
-            hourly_count = self._hourly_count(subscription_ref, hk)
+            hourly_count = self._hourly_count(subscription_ref, bucket)
             if hourly_count >= self._guardrail.hourly_cap:
                 anomaly = AnomalyRecord(
                     subscription_ref=subscription_ref,
@@ -198,7 +391,7 @@ class MarketplaceMeteringClient:
 
         # --- Guardrail: daily cap ---
         if self._guardrail.daily_cap > 0:
-            daily_count = self._daily_count(subscription_ref, dk)
+            daily_count = self._daily_count(subscription_ref, bucket // 24)
             if daily_count >= self._guardrail.daily_cap:
                 anomaly = AnomalyRecord(
                     subscription_ref=subscription_ref,
@@ -222,15 +415,31 @@ class MarketplaceMeteringClient:
                 )
                 return False
 
-        self._completions[key].add(task_id)
-
-        _log.log_event(
-            "task_recorded",
-            correlation_id=cid,
-            subscription_ref=subscription_ref,
-            task_id=task_id,
-            hour_key=hk,
-        )
+        if seen is None:
+            # First task in this window; a rejected attempt creates nothing.
+            self._completions[key] = {task_id}
+            with self._index_lock:
+                self._by_hour[bucket][subscription_ref] = None
+                self._pending[key] = None
+        else:
+            seen.add(task_id)
+        self._quantities[key] += 1
+        self._daily_quantities[(subscription_ref, bucket // 24)] += 1
+
+        if self._sink is not None:
+            self._sink.push("task_recorded", cid, {
+                "subscription_ref": subscription_ref,
+                "task_id": task_id,
+                "hour_key": hk,
+            })
+        elif self._audit_mode == "sync":
+            _log.log_event(
+                "task_recorded",
+                correlation_id=cid,
+                subscription_ref=subscription_ref,
+                task_id=task_id,
+                hour_key=hk,
+            )
         return True
 
     # ------------------------------------------------------------------
@@ -258,24 +467,37 @@ class MarketplaceMeteringClient:
         list[UsageEvent]
             The usage events that were emitted (one per subscription per
             hour window).
+
+        Concurrent calls are serialized, so each window is submitted once.
         """
-        cid = correlation_id or ""
-        events: List[UsageEvent] = []
+        if self._sink is not None:
+            # Keep task_recorded ahead of the aggregation/submission events.
+            self._sink.flush()
+        with self._submit_lock:
+            return self._aggregate_and_submit(hour_window, correlation_id or "")
+
+    def _aggregate_and_submit(
+        self, hour_window: Optional[str], cid: str
+    ) -> List[UsageEvent]:
+        pending: List[_Pending] = []
 
-        keys = (
-            [k for k in self._completions if k[1] == hour_window]
-            if hour_window
-            else list(self._completions)
-        )
+        if hour_window:
+            window = _iso_to_bucket(hour_window)
+            with self._index_lock:
+                # A window of None (not an hour key) is never in _by_hour.
+                keys = [(sub, window) for sub in self._by_hour.get(window, ())]
+        else:
+            with self._index_lock:
+                keys = list(self._pending)  # snapshot; recorders may add keys
 
         for key in keys:
             if key in self._submitted:
                 continue  # already submitted — idempotent guard
 
-            subscription_ref, hk = key
-            quantity = len(self._completions[key])
-            if quantity == 0:
-                continue
+            subscription_ref, bucket = key
+            hk = _bucket_to_iso(bucket)
+            with self._stripe_lock(subscription_ref):
+                quantity = self._quantities[key]
 
             event = UsageEvent(
                 resourceId=subscription_ref,
@@ -292,27 +514,99 @@ class MarketplaceMeteringClient:
                 hour_window=hk,
                 quantity=quantity,
             )
+            pending.append((key, event))
+
+        if self._dry_run:
+            for _, event in pending:
+                if self._dry_run_pretty:
+                    self._print_fn(
+                        f"[dry-run] Usage event: {_json.dumps_indented(event.to_dict())}"
+                    )
+                else:
+                    self._print_fn(
+                        f"[dry-run] Usage event: resourceId={event.resourceId} "
+                        f"quantity={event.quantity} dimension={event.dimension} "
+                        f"effectiveStartTime={event.effectiveStartTime} "
+                        f"planId={event.planId}"
+                    )
+            if pending:
+                batches = sum(1 for _ in self._batches(pending))
+                self._print_fn(f"[dry-run] {len(pending)} event(s) in {batches} batch(es)")
+            self._mark_submitted(pending, cid)
+        elif self._batch_submit_callback is not None:
+            for batch in self._batches(pending):
+                self._batch_submit_callback([e.to_dict() for _, e in batch])
+                # Only acknowledged batches are marked; a failure leaves the
+                # remaining windows pending so a retry resends the same records.
+                self._mark_submitted(batch, cid)
+        else:
+            for item in pending:
+                if self._submit_callback is not None:
+                    self._submit_callback(item[1].to_dict())
+                self._mark_submitted([item], cid)
+
+        if self._guardrail.retention_hours > 0:
+            self._evict_expired()
+        return [event for _, event in pending]
+
+    def _evict_expired(self) -> None:
+        """Free submitted windows at or behind their subscription's horizon."""
+        retention = self._guardrail.retention_hours
+        with self._index_lock:
+            submitted = list(self._submitted)
+        for key in submitted:
+            sub, bucket = key
+            with self._stripe_lock(sub):
+                if bucket > self._newest_bucket.get(sub, bucket) - retention:
+                    continue
+                del self._completions[key]
+                del self._quantities[key]
+                with self._index_lock:
+                    self._submitted.discard(key)
+                    subs = self._by_hour[bucket]
+                    del subs[sub]
+                    if not subs:
+                        del self._by_hour[bucket]
+        # Days whose last hour is behind the horizon take no more recordings.
+        for key in list(self._daily_quantities):
+            sub, day = key
+            with self._stripe_lock(sub):
+                if day * 24 + 23 <= self._newest_bucket.get(sub, 0) - retention:
+                    self._daily_quantities.pop(key, None)
+
+    def _batches(self, pending: List[_Pending]) -> Iterator[List[_Pending]]:
+        """Yield chunks of at most ``batch_size`` events under ``_PAYLOAD_MAX`` bytes."""
+        it = iter(pending)
+        while True:
+            chunk = list(islice(it, self._batch_size))
+            if not chunk:
+                return
+            yield from MarketplaceMeteringClient._split_payload(chunk)
 
-            if self._dry_run:
-                print(
-                    f"[dry-run] Usage event: {json.dumps(event.to_dict(), indent=2)}"
-                )
-            elif self._submit_callback is not None:
-                self._submit_callback(event.to_dict())
-
+    @staticmethod
+    def _split_payload(chunk: List[_Pending]) -> Iterator[List[_Pending]]:
+        # Sized with stdlib spacing, the widest form a callback is likely to send.
+        encoded = json.dumps([e.to_dict() for _, e in chunk])
+        if len(encoded) <= _PAYLOAD_MAX or len(chunk) == 1:
+            yield chunk
+            return
+        mid = len(chunk) // 2
+        yield from MarketplaceMeteringClient._split_payload(chunk[:mid])
+        yield from MarketplaceMeteringClient._split_payload(chunk[mid:])
+
+    def _mark_submitted(self, pending: List[_Pending], cid: str) -> None:
+        for key, event in pending:
             _log.log_event(
                 "marketplace_submission",
                 correlation_id=cid,
-                subscription_ref=subscription_ref,
-                hour_window=hk,
-                quantity=quantity,
+                subscription_ref=event.resourceId,
+                hour_window=event.effectiveStartTime,
+                quantity=event.quantity,
                 dry_run=self._dry_run,
             )
-
-            self._submitted.add(key)
-            events.append(event)
-
-        return events
+            with self._index_lock:
+                self._submitted.add(key)
+                self._pending.pop(key, None)
 
     # ------------------------------------------------------------------
     # Introspection helpers
@@ -322,7 +616,8 @@ class MarketplaceMeteringClient:
         self, subscription_ref: str, hour_window: str
     ) -> int:
         """Return the number of unique tasks recorded for a window."""
-        return len(self._completions.get((subscription_ref, hour_window), set()))
+        # Counter lookups do not insert, so a None window simply counts 0.
+        return self._quantities[(subscription_ref, _iso_to_bucket(hour_window))]
 
     @property
     def anomalies(self) -> List[AnomalyRecord]:
@@ -0,0 +1,10 @@
+"""Shared pytest hooks."""
+
+import pytest
+
+
+def pytest_collection_modifyitems(items):
+    # Anything that talks to a live HTTP server is slow; see the ``slow`` marker.
+    for item in items:
+        if "server" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.slow)
@@ -1,9 +1,18 @@
 """Unit tests for audit logging, correlation IDs, guardrails, and anomaly detection."""
 
+import atexit
+import io
 import json
+import logging
+import time
 from datetime import datetime, timezone
 
-from agent_task_metering.audit_logger import AuditLogger, get_audit_logger
+from agent_task_metering.audit_logger import (
+    AsyncAuditSink,
+    AuditLogger,
+    BatchedAuditHandler,
+    get_audit_logger,
+)
 from agent_task_metering.metering.client import (
     AnomalyRecord,
     GuardrailConfig,
@@ -35,10 +44,126 @@ def test_audit_logger_returns_payload():
     assert result["foo"] == "bar"
 
 
+def test_audit_logger_disabled_level_skips_emit(capfd):
+    """A level below the logger threshold emits nothing."""
+    logger = AuditLogger("test.audit.disabled")
+    logging.getLogger("test.audit.disabled").setLevel(logging.WARNING)
+    result = logger.log_event("quiet", correlation_id="c2", foo="bar")
+    assert capfd.readouterr().err == ""
+    assert result == {"event": "quiet", "correlation_id": "c2"}
+
+
 def test_get_audit_logger_returns_instance():
     assert isinstance(get_audit_logger(), AuditLogger)
 
 
+# ---- BatchedAuditHandler -------------------------------------------------
+
+
+def _batched_logger(name, **kwargs):
+    stream = io.StringIO()
+    handler = BatchedAuditHandler(stream, **kwargs)
+    logging.getLogger(name).addHandler(handler)
+    logging.getLogger(name).setLevel(logging.INFO)
+    return AuditLogger(name), handler, stream
+
+
+def test_batched_handler_writes_groups_on_flush():
+    logger, handler, stream = _batched_logger("test.audit.batched")
+    try:
+        for i in range(5):
+            logger.log_event("task_recorded", correlation_id=f"c{i}")
+        handler.flush()
+        lines = stream.getvalue().splitlines()
+        assert [json.loads(line)["correlation_id"] for line in lines] == [
+            "c0", "c1", "c2", "c3", "c4",
+        ]
+    finally:
+        logging.getLogger("test.audit.batched").removeHandler(handler)
+        handler.close()
+
+
+def test_batched_handler_sync_event_written_before_return():
+    logger, handler, stream = _batched_logger(
+        "test.audit.batched.sync", max_delay=10.0
+    )
+    try:
+        start = time.monotonic()
+        logger.log_event("task_recorded", correlation_id="before")
+        logger.log_event("marketplace_submission", correlation_id="sync")
+        events = [json.loads(line)["event"] for line in stream.getvalue().splitlines()]
+        assert events == ["task_recorded", "marketplace_submission"]
+        # Written straight away, not after the 10 s group deadline.
+        assert time.monotonic() - start < 5.0
+    finally:
+        logging.getLogger("test.audit.batched.sync").removeHandler(handler)
+        handler.close()
+
+
+def test_batched_handler_close_drains_queue():
+    logger, handler, stream = _batched_logger(
+        "test.audit.batched.close", max_delay=10.0
+    )
+    logger.log_event("task_recorded", correlation_id="last")
+    logging.getLogger("test.audit.batched.close").removeHandler(handler)
+    handler.close()
+    assert json.loads(stream.getvalue())["correlation_id"] == "last"
+
+
+def test_batched_handler_writes_inline_after_close():
+    logger, handler, stream = _batched_logger("test.audit.batched.closed")
+    try:
+        handler.close()
+        logger.log_event("marketplace_submission", correlation_id="sync")
+        logger.log_event("task_recorded", correlation_id="plain")
+        assert [
+            json.loads(line)["correlation_id"] for line in stream.getvalue().splitlines()
+        ] == ["sync", "plain"]
+    finally:
+        logging.getLogger("test.audit.batched.closed").removeHandler(handler)
+
+
+# ---- AsyncAuditSink -------------------------------------------------------
+
+
+class _FlakyLogger:
+    """Stands in for AuditLogger; raises on the event named "bad"."""
+
+    def __init__(self):
+        self.logged = []
+
+    def log_event(self, event, correlation_id="", **fields):
+        if event == "bad":
+            raise RuntimeError("write failed")
+        self.logged.append(correlation_id)
+
+
+def test_async_sink_survives_a_failed_write(capsys):
+    logger = _FlakyLogger()
+    sink = AsyncAuditSink(logger)
+    try:
+        sink.push("bad", "c0", {})
+        sink.push("task_recorded", "c1", {})
+        sink.flush()  # would hang if the worker had died on "bad"
+        assert logger.logged == ["c1"]
+        assert "write failed" in capsys.readouterr().err
+    finally:
+        sink.close()
+
+
+def test_async_sink_close_drains_queue_and_unregisters(monkeypatch):
+    registered = []
+    monkeypatch.setattr(atexit, "register", registered.append)
+    monkeypatch.setattr(atexit, "unregister", registered.remove)
+    logger = _FlakyLogger()
+    sink = AsyncAuditSink(logger)
+    for i in range(3):
+        sink.push("task_recorded", f"c{i}", {})
+    assert registered == [sink.close]
+    sink.close()
+    assert logger.logged == ["c0", "c1", "c2"]
+    assert registered == []
+
 # ---- GuardrailConfig defaults --------------------------------------------
 
 
@@ -1,86 +1,92 @@
 """Unit tests for the evaluation REST API."""
 
-import json
 import threading
 from http.client import HTTPConnection
 
 import pytest
 
-from agent_task_metering.evaluation.api import create_server
+from agent_task_metering import _json
+from agent_task_metering.evaluation.api import (
+    _EVALUATION_FIELDS,
+    _RECORD_FIELDS,
+    _missing_fields_error,
+    create_server,
+)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def server():
-    """Start the API on a random free port and tear down after the test."""
+    """Start the API once on a random free port for every test in this module.
+
+    Tests only look up the audit records they created themselves (by
+    correlation ID), so sharing one server and audit store is safe.
+    """
     srv = create_server(host="127.0.0.1", port=0)  # port 0 → OS picks free port
     _, port = srv.server_address
-    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t = threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
     t.start()
     yield port
     srv.shutdown()
+    srv.server_close()
 
 
-def _post_json(port: int, path: str, body: dict) -> tuple:
-    """Helper: POST JSON and return (status, parsed_body)."""
-    conn = HTTPConnection("127.0.0.1", port)
-    payload = json.dumps(body).encode()
-    conn.request("POST", path, body=payload, headers={"Content-Type": "application/json"})
-    resp = conn.getresponse()
-    data = json.loads(resp.read())
-    status = resp.status
+@pytest.fixture()
+def http_conn(server):
+    """One keep-alive connection shared by every request in a test."""
+    conn = HTTPConnection("127.0.0.1", server)
+    yield conn
     conn.close()
-    return status, data
 
 
-def _get_json(port: int, path: str) -> tuple:
+# Canonical passing request, encoded once for every test that posts it.
+PASSING_PAYLOAD = _json.dumps({
+    "task_id": "t1",
+    "agent_id": "a1",
+    "subscription_ref": "sub-1",
+    "evidence": {
+        "outputs": {"terminal_success": True, "result": "ok"},
+        "traces": [{"step": 1}],
+    },
+})
+
+
+def _post_raw(conn: HTTPConnection, path: str, body: bytes) -> tuple:
+    """Helper: POST pre-encoded JSON and return (status, parsed_body)."""
+    conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+    resp = conn.getresponse()
+    return resp.status, _json.loads(resp.read())
+
+
+def _post_json(conn: HTTPConnection, path: str, body: dict) -> tuple:
+    """Helper: POST JSON and return (status, parsed_body)."""
+    return _post_raw(conn, path, _json.dumps(body))
+
+
+def _get_json(conn: HTTPConnection, path: str) -> tuple:
     """Helper: GET and return (status, parsed_body)."""
-    conn = HTTPConnection("127.0.0.1", port)
     conn.request("GET", path)
     resp = conn.getresponse()
-    data = json.loads(resp.read())
-    status = resp.status
-    conn.close()
-    return status, data
+    return resp.status, _json.loads(resp.read())
 
 
 # ---- POST /evaluate ------------------------------------------------------
 
 
-def test_evaluate_passing_payload(server):
-    """Passing evidence → intent_handled=True, adhered=True, billable_units=1."""
-    status, body = _post_json(server, "/evaluate", {
-        "task_id": "t1",
-        "agent_id": "a1",
-        "subscription_ref": "sub-1",
-        "evidence": {
-            "outputs": {"terminal_success": True, "result": "ok"},
-            "traces": [{"step": 1}],
-        },
-    })
+def test_evaluate_response_shape(http_conn):
+    """A valid request returns 200 with the serialized EvaluationResult."""
+    status, body = _post_raw(http_conn, "/evaluate", PASSING_PAYLOAD)
     assert status == 200
+    # Known values for PASSING_PAYLOAD prove the evidence reached the evaluator.
     assert body["intent_handled"] is True
     assert body["adhered"] is True
     assert body["billable_units"] == 1
-    assert body["correlation_id"]
-    assert isinstance(body["reason_codes"], list)
-
-
-def test_evaluate_failing_payload(server):
-    """Failing evidence → adhered=False, billable_units=0."""
-    status, body = _post_json(server, "/evaluate", {
-        "task_id": "t2",
-        "agent_id": "a1",
-        "subscription_ref": "sub-1",
-        "evidence": {"outputs": {"status": "failed"}},
-    })
-    assert status == 200
-    assert body["adhered"] is False
-    assert body["billable_units"] == 0
+    assert isinstance(body["correlation_id"], str) and body["correlation_id"]
+    assert body["reason_codes"][1] == "terminal_success:passed"
 
 
-def test_evaluate_missing_fields(server):
+def test_evaluate_missing_fields(http_conn):
     """Missing required fields → 400 error."""
-    status, body = _post_json(server, "/evaluate", {"task_id": "t1"})
+    status, body = _post_json(http_conn, "/evaluate", {"task_id": "t1"})
     assert status == 400
     assert "Missing fields" in body["error"]
 
@@ -94,49 +100,83 @@ def test_evaluate_invalid_json(server):
     conn.close()
 
 
-def test_evaluate_minimal_evidence(server):
-    """Evidence with empty outputs → adhered=False."""
-    status, body = _post_json(server, "/evaluate", {
-        "task_id": "t3",
-        "agent_id": "a1",
-        "subscription_ref": "sub-1",
-    })
-    assert status == 200
-    assert body["adhered"] is False
-    assert body["billable_units"] == 0
+def test_evaluate_payload_too_large(server):
+    """A Content-Length above MAX_BODY is rejected with 413 before reading."""
+    conn = HTTPConnection("127.0.0.1", server)
+    conn.putrequest("POST", "/evaluate")
+    conn.putheader("Content-Type", "application/json")
+    conn.putheader("Content-Length", str((1 << 20) + 1))
+    conn.endheaders()
+    resp = conn.getresponse()
+    assert resp.status == 413
+    assert _json.loads(resp.read())["error"] == "Payload too large"
+    conn.close()
+
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_evaluate_bad_content_length_closes_connection(server, length):
+    """A malformed Content-Length → 400, and the unread body is not reused."""
+    conn = HTTPConnection("127.0.0.1", server, timeout=5)
+    conn.putrequest("POST", "/evaluate")
+    conn.putheader("Content-Type", "application/json")
+    conn.putheader("Content-Length", length)
+    conn.endheaders()
+    resp = conn.getresponse()
+    assert resp.status == 400
+    assert _json.loads(resp.read())["error"] == "Invalid JSON"
+    assert conn.sock.recv(1) == b""  # the server hung up
+    conn.close()
+
+# ---- Request validation (no server) ---------------------------------------
+
+
+@pytest.mark.parametrize(
+    "fields,raw,expected",
+    [
+        (_EVALUATION_FIELDS, {"task_id": "t1"}, "Missing fields: agent_id, subscription_ref"),
+        (_EVALUATION_FIELDS, {"task_id": "t1", "agent_id": "a1", "subscription_ref": "s"}, None),
+        (_RECORD_FIELDS, {"task_id": "t1"}, "Missing fields: subscription_ref"),
+        (_RECORD_FIELDS, {"task_id": "t1", "subscription_ref": "s"}, None),
+    ],
+    ids=["evaluation-missing", "evaluation-ok", "record-missing", "record-ok"],
+)
+def test_missing_fields_error(fields, raw, expected):
+    assert _missing_fields_error(raw, fields) == expected
 
 
 # ---- GET /audit/<correlation_id> -----------------------------------------
 
 
-def test_audit_record_retrievable(server):
+def test_audit_record_retrievable(http_conn):
     """After evaluation, the audit record is retrievable by correlation ID."""
-    _, eval_body = _post_json(server, "/evaluate", {
-        "task_id": "t-audit",
-        "agent_id": "a1",
-        "subscription_ref": "sub-1",
-        "evidence": {"outputs": {"terminal_success": True}},
-    })
+    _, eval_body = _post_raw(http_conn, "/evaluate", PASSING_PAYLOAD)
     cid = eval_body["correlation_id"]
 
-    status, audit = _get_json(server, f"/audit/{cid}")
+    status, audit = _get_json(http_conn, f"/audit/{cid}")
     assert status == 200
     assert audit["correlation_id"] == cid
-    assert audit["task_id"] == "t-audit"
+    assert audit["task_id"] == "t1"
     assert audit["adhered"] is True
 
 
-def test_audit_not_found(server):
+def test_audit_not_found(http_conn):
     """Unknown correlation ID → 404."""
-    status, body = _get_json(server, "/audit/nonexistent")
+    status, body = _get_json(http_conn, "/audit/nonexistent")
+    assert status == 404
+
+
+def test_audit_invalid_correlation_id(http_conn):
+    """Correlation IDs outside [A-Za-z0-9_-] are not routed."""
+    status, body = _get_json(http_conn, "/audit/../health")
     assert status == 404
+    assert body["error"] == "Not found"
 
 
 # ---- GET /health ----------------------------------------------------------
 
 
-def test_health_endpoint(server):
-    status, body = _get_json(server, "/health")
+def test_health_endpoint(http_conn):
+    status, body = _get_json(http_conn, "/health")
     assert status == 200
     assert body["status"] == "ok"
 
@@ -144,22 +184,22 @@ def test_health_endpoint(server):
 # ---- 404 for unknown routes -----------------------------------------------
 
 
-def test_unknown_post_route(server):
-    status, body = _post_json(server, "/unknown", {})
+def test_unknown_post_route(http_conn):
+    status, body = _post_json(http_conn, "/unknown", {})
     assert status == 404
 
 
-def test_unknown_get_route(server):
-    status, body = _get_json(server, "/unknown")
+def test_unknown_get_route(http_conn):
+    status, body = _get_json(http_conn, "/unknown")
     assert status == 404
 
 
 # ---- Intent resolution via API -------------------------------------------
 
 
-def test_evaluate_with_query_response(server):
+def test_evaluate_with_query_response(http_conn):
     """Evidence with query+response is parsed and returned."""
-    status, body = _post_json(server, "/evaluate", {
+    status, body = _post_json(http_conn, "/evaluate", {
         "task_id": "t-intent",
         "agent_id": "a1",
         "subscription_ref": "sub-1",
@@ -173,3 +213,36 @@ def test_evaluate_with_query_response(server):
     assert body["intent_handled"] is True
     assert body["adhered"] is True
     assert body["billable_units"] == 1
+
+
+# ---- Keep-alive / concurrency ---------------------------------------------
+
+
+def test_keep_alive_connection_reused(server):
+    """Several requests can share one HTTP/1.1 connection."""
+    conn = HTTPConnection("127.0.0.1", server)
+    for _ in range(3):
+        conn.request("GET", "/health")
+        resp = conn.getresponse()
+        assert resp.status == 200
+        assert _json.loads(resp.read())["status"] == "ok"
+    conn.close()
+
+
+def test_concurrent_requests(server):
+    """Requests on separate connections are served in parallel threads."""
+    results = []
+
+    def worker():
+        conn = HTTPConnection("127.0.0.1", server)
+        results.append(_post_raw(conn, "/evaluate", PASSING_PAYLOAD))
+        conn.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(results) == 8
+    assert all(status == 200 for status, _ in results)
+    assert len({body["correlation_id"] for _, body in results}) == 8
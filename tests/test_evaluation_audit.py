@@ -0,0 +1,128 @@
+"""Unit tests for the in-memory AuditStore."""
+
+import threading
+
+import pytest
+
+from agent_task_metering.evaluation.audit import AuditStore
+from agent_task_metering.evaluation.models import AuditRecord
+
+
+def _audit(cid):
+    return AuditRecord(
+        correlation_id=cid,
+        task_id=f"task-{cid}",
+        agent_id="a1",
+        subscription_ref="sub-1",
+        evidence={},
+        intent_handled=True,
+        adhered=True,
+        billable_units=1,
+        reason_codes=[],
+    )
+
+
+# ---- Bounded retention ----------------------------------------------------
+
+
+def test_unbounded_by_default():
+    store = AuditStore()
+    for i in range(50):
+        store.record(_audit(str(i)))
+    assert len(store) == 50
+
+
+def test_max_records_evicts_oldest():
+    store = AuditStore(max_records=3)
+    for cid in ("a", "b", "c", "d"):
+        store.record(_audit(cid))
+    assert len(store) == 3
+    assert store.get("a") is None
+    assert [r.correlation_id for r in store.list_records()] == ["b", "c", "d"]
+
+
+def test_overwrite_at_cap_does_not_evict():
+    store = AuditStore(max_records=2)
+    store.record(_audit("a"))
+    store.record(_audit("b"))
+    store.record(_audit("a"))
+    assert [r.correlation_id for r in store.list_records()] == ["a", "b"]
+
+
+def test_spill_receives_evicted_records():
+    spilled = []
+
+    class SpillingStore(AuditStore):
+        def spill(self, audit):
+            spilled.append(audit.correlation_id)
+
+    store = SpillingStore(max_records=2)
+    for cid in ("a", "b", "c", "d"):
+        store.record(_audit(cid))
+    assert spilled == ["a", "b"]
+
+
+def test_max_records_must_be_positive():
+    with pytest.raises(ValueError):
+        AuditStore(max_records=0)
+
+
+def test_clear_drops_records_without_spilling():
+    spilled = []
+
+    class SpillingStore(AuditStore):
+        def spill(self, audit):
+            spilled.append(audit.correlation_id)
+
+    store = SpillingStore()
+    store.record_many(_audit(cid) for cid in ("a", "b"))
+    store.clear()
+    assert len(store) == 0
+    assert store.get("a") is None
+    assert spilled == []
+
+
+def test_record_many_matches_record():
+    spilled = []
+
+    class SpillingStore(AuditStore):
+        def spill(self, audit):
+            spilled.append(audit.correlation_id)
+
+    store = SpillingStore(max_records=2)
+    store.record_many([_audit(cid) for cid in ("a", "b", "c")])
+    assert [r.correlation_id for r in store.list_records()] == ["b", "c"]
+    assert spilled == ["a"]
+
+    unbounded = AuditStore()
+    unbounded.record_many(_audit(cid) for cid in ("a", "b", "a"))
+    assert [r.correlation_id for r in unbounded.list_records()] == ["a", "b"]
+
+
+# ---- Concurrency ----------------------------------------------------------
+
+
+@pytest.mark.slow
+def test_concurrent_record_respects_cap_and_spills_every_eviction():
+    spilled = []
+
+    class SpillingStore(AuditStore):
+        def spill(self, audit):
+            spilled.append(audit.correlation_id)
+
+    store = SpillingStore(max_records=100)
+
+    def writer(prefix):
+        for i in range(500):
+            store.record(_audit(f"{prefix}-{i}"))
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(store) == 100
+    assert len(spilled) == 1900
+    kept = {r.correlation_id for r in store.list_records()}
+    assert kept.isdisjoint(spilled)
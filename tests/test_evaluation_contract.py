@@ -1,5 +1,7 @@
 """Unit tests for the TaskAdherenceContract."""
 
+import pytest
+
 from agent_task_metering.evaluation.contract import ContractConfig, TaskAdherenceContract
 from agent_task_metering.evaluation.models import Evidence
 
@@ -88,153 +90,152 @@ def test_intent_resolution_custom_threshold():
     assert intent_handled is False
 
 
-# ---- Terminal success gate ------------------------------------------------
+# ---- Shared contracts -----------------------------------------------------
 
 
-def test_terminal_success_with_flag():
-    """outputs['terminal_success'] = True → passes gate 1."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"terminal_success": True})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is True
-    assert "terminal_success:passed" in codes
+@pytest.fixture(scope="module")
+def default_contract():
+    return TaskAdherenceContract()
 
 
-def test_terminal_success_with_status_completed():
-    """outputs['status'] = 'completed' → passes gate 1."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"status": "completed"})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is True
-    assert "terminal_success:passed" in codes
+@pytest.fixture(scope="module")
+def required_contract():
+    return TaskAdherenceContract(ContractConfig(required_output_keys=["result", "summary"]))
 
 
-def test_terminal_success_with_status_success():
-    """outputs['status'] = 'success' → passes gate 1."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"status": "Success"})
-    _, adhered, _ = contract.evaluate(evidence)
-    assert adhered is True
+@pytest.fixture(scope="module")
+def approval_contract():
+    return TaskAdherenceContract(ContractConfig(require_approval=True))
 
 
-def test_terminal_success_fails_with_no_signal():
-    """No success signal → fails gate 1."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"result": "some data"})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is False
-    assert "terminal_success:failed" in codes
+def _has_code(codes, prefix):
+    return any(c.startswith(prefix) for c in codes)
 
 
-def test_terminal_success_fails_with_wrong_status():
-    """status='failed' → fails gate 1."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"status": "failed"})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is False
-    assert "terminal_success:failed" in codes
-
-
-# ---- Required outputs gate -----------------------------------------------
+# ---- Terminal success gate ------------------------------------------------
 
 
-def test_required_outputs_passes():
-    """All required keys present → passes gate 2."""
-    config = ContractConfig(required_output_keys=["result", "summary"])
-    contract = TaskAdherenceContract(config)
-    evidence = Evidence(
-        outputs={"terminal_success": True, "result": "ok", "summary": "done"}
-    )
-    _, adhered, codes = contract.evaluate(evidence)
+@pytest.mark.parametrize(
+    "outputs,expected_adhered,expected_code",
+    [
+        ({"terminal_success": True}, True, "terminal_success:passed"),
+        ({"status": "completed"}, True, "terminal_success:passed"),
+        ({"status": "Success"}, True, "terminal_success:passed"),
+        ({"result": "some data"}, False, "terminal_success:failed"),
+        ({"status": "failed"}, False, "terminal_success:failed"),
+        ({"status": 1}, False, "terminal_success:failed"),
+    ],
+    ids=[
+        "flag", "status_completed", "status_success", "no_signal", "wrong_status",
+        "non_str_status",
+    ],
+)
+def test_terminal_success(default_contract, outputs, expected_adhered, expected_code):
+    """A success flag or a success status passes gate 1; anything else fails."""
+    _, adhered, codes = default_contract.evaluate(Evidence(outputs=outputs))
+    assert adhered is expected_adhered
+    assert expected_code in codes
+
+
+def test_terminal_success_reads_outputs_at_evaluation(default_contract):
+    """A status set after construction is still seen by gate 1."""
+    evidence = Evidence(outputs={})
+    evidence.outputs["status"] = "completed"
+    _, adhered, codes = default_contract.evaluate(evidence)
     assert adhered is True
-    assert "required_outputs:passed" in codes
+    assert codes[1] == "terminal_success:passed"
 
 
-def test_required_outputs_fails_missing_key():
-    """Missing a required key → fails gate 2."""
-    config = ContractConfig(required_output_keys=["result", "summary"])
-    contract = TaskAdherenceContract(config)
-    evidence = Evidence(outputs={"terminal_success": True, "result": "ok"})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is False
-    assert any("required_outputs:missing" in c for c in codes)
+# ---- Required outputs gate -----------------------------------------------
 
 
-def test_required_outputs_skipped_when_empty():
+@pytest.mark.parametrize(
+    "outputs,expected_adhered,expected_code",
+    [
+        (
+            {"terminal_success": True, "result": "ok", "summary": "done"},
+            True,
+            "required_outputs:passed",
+        ),
+        ({"terminal_success": True, "result": "ok"}, False, "required_outputs:missing"),
+    ],
+    ids=["all_present", "missing_key"],
+)
+def test_required_outputs(required_contract, outputs, expected_adhered, expected_code):
+    """Every configured key must be present to pass gate 2."""
+    _, adhered, codes = required_contract.evaluate(Evidence(outputs=outputs))
+    assert adhered is expected_adhered
+    assert _has_code(codes, expected_code)
+
+
+def test_required_outputs_skipped_when_empty(default_contract):
     """No required keys configured → gate 2 is skipped."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"terminal_success": True})
-    _, _, codes = contract.evaluate(evidence)
+    _, _, codes = default_contract.evaluate(Evidence(outputs={"terminal_success": True}))
     assert "required_outputs:skipped" in codes
 
 
-# ---- Output validation gate -----------------------------------------------
-
-
-def test_output_validation_passes():
-    """Non-null, non-empty values → passes gate 3."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"terminal_success": True, "data": "value"})
-    _, adhered, codes = contract.evaluate(evidence)
+def test_required_keys_read_once_at_construction():
+    """Mutating the config list later does not change a built contract."""
+    config = ContractConfig(required_output_keys=["result"])
+    contract = TaskAdherenceContract(config)
+    config.required_output_keys.append("summary")
+    _, adhered, codes = contract.evaluate(
+        Evidence(outputs={"terminal_success": True, "result": "ok"})
+    )
     assert adhered is True
-    assert "output_validation:passed" in codes
+    assert "required_outputs:passed" in codes
 
 
-def test_output_validation_fails_null_value():
-    """A null value → fails gate 3."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"terminal_success": True, "bad": None})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is False
-    assert any("output_validation:invalid" in c for c in codes)
+# ---- Output validation gate -----------------------------------------------
 
 
-def test_output_validation_fails_empty_string():
-    """An empty string value → fails gate 3."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"terminal_success": True, "empty": ""})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is False
-    assert any("output_validation:invalid" in c for c in codes)
+# The gates never mutate evidence, so each case is built once at import and shared.
+_OUTPUT_VALIDATION_CASES = [
+    pytest.param(
+        Evidence(outputs={"terminal_success": True, "data": value}),
+        expected_adhered,
+        expected_code,
+        id=case_id,
+    )
+    for case_id, value, expected_adhered, expected_code in (
+        ("non_empty", "value", True, "output_validation:passed"),
+        ("null", None, False, "output_validation:invalid"),
+        ("empty_string", "", False, "output_validation:invalid"),
+        ("whitespace_only", "   ", False, "output_validation:invalid"),
+    )
+]
 
 
-def test_output_validation_whitespace_only_fails():
-    """A whitespace-only string → fails gate 3."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"terminal_success": True, "ws": "   "})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is False
+@pytest.mark.parametrize("evidence,expected_adhered,expected_code", _OUTPUT_VALIDATION_CASES)
+def test_output_validation(default_contract, evidence, expected_adhered, expected_code):
+    """Null, empty and whitespace-only values fail gate 3."""
+    _, adhered, codes = default_contract.evaluate(evidence)
+    assert adhered is expected_adhered
+    assert _has_code(codes, expected_code)
 
 
 # ---- Approval gate -------------------------------------------------------
 
 
-def test_approval_skipped_by_default():
+def test_approval_skipped_by_default(default_contract):
     """When require_approval=False, gate 4 is skipped."""
-    contract = TaskAdherenceContract()
-    evidence = Evidence(outputs={"terminal_success": True})
-    _, _, codes = contract.evaluate(evidence)
+    _, _, codes = default_contract.evaluate(Evidence(outputs={"terminal_success": True}))
     assert "approval:skipped" in codes
 
 
-def test_approval_passes():
-    """approved=True → passes gate 4."""
-    config = ContractConfig(require_approval=True)
-    contract = TaskAdherenceContract(config)
-    evidence = Evidence(outputs={"terminal_success": True, "approved": True})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is True
-    assert "approval:passed" in codes
-
-
-def test_approval_fails():
-    """approved missing or falsy → fails gate 4."""
-    config = ContractConfig(require_approval=True)
-    contract = TaskAdherenceContract(config)
-    evidence = Evidence(outputs={"terminal_success": True})
-    _, adhered, codes = contract.evaluate(evidence)
-    assert adhered is False
-    assert "approval:failed" in codes
+@pytest.mark.parametrize(
+    "outputs,expected_adhered,expected_code",
+    [
+        ({"terminal_success": True, "approved": True}, True, "approval:passed"),
+        ({"terminal_success": True}, False, "approval:failed"),
+    ],
+    ids=["approved", "not_approved"],
+)
+def test_approval(approval_contract, outputs, expected_adhered, expected_code):
+    """With require_approval=True, only a truthy ``approved`` passes gate 4."""
+    _, adhered, codes = approval_contract.evaluate(Evidence(outputs=outputs))
+    assert adhered is expected_adhered
+    assert expected_code in codes
 
 
 # ---- Combined / acceptance criteria --------------------------------------
@@ -279,3 +280,46 @@ def test_intent_and_adherence_both_required():
     intent_handled, adhered, _ = contract.evaluate(evidence)
     assert intent_handled is False
     assert adhered is True
+
+
+# ---- Gate result details --------------------------------------------------
+
+
+def test_unhashable_evidence_evaluated():
+    """Outputs holding lists/dicts evaluate like any other value."""
+    contract = TaskAdherenceContract()
+    evidence = Evidence(outputs={"terminal_success": True, "items": [1, 2]})
+    _, adhered, _ = contract.evaluate(evidence)
+    assert adhered is True
+
+
+def test_adherence_does_not_run_intent_gate():
+    """evaluate_adherence ignores an intent score gate 0 could not compare."""
+    contract = TaskAdherenceContract(ContractConfig(require_intent_resolution=True))
+    evidence = Evidence(
+        outputs={"terminal_success": True}, scores={"intent_resolution": "high"}
+    )
+    adhered, codes = contract.evaluate_adherence(evidence)
+    assert adhered is True
+    assert len(codes) == 4
+
+
+def test_reason_codes_render_value_types():
+    """2 and 2.0 compare equal but produce different reason codes."""
+    config = ContractConfig(require_intent_resolution=True)
+    contract = TaskAdherenceContract(config)
+    _, _, int_codes = contract.evaluate(Evidence(scores={"intent_resolution": 2}))
+    _, _, float_codes = contract.evaluate(Evidence(scores={"intent_resolution": 2.0}))
+    assert int_codes[0] == "intent_resolution:score_below_threshold=2"
+    assert float_codes[0] == "intent_resolution:score_below_threshold=2.0"
+
+
+def test_reason_codes_share_interned_strings():
+    contract = TaskAdherenceContract()
+    evidence = Evidence(outputs={"terminal_success": True})
+    _, _, first = contract.evaluate(evidence)
+    _, _, second = contract.evaluate(Evidence(outputs={"terminal_success": True}))
+    assert isinstance(first, tuple)
+    assert first == second
+    assert all(a is b for a, b in zip(first, second))
+    assert contract.evaluate_adherence(evidence)[1] == first[1:]
@@ -1,10 +1,32 @@
 """Unit tests for the TaskAdherenceEvaluator (orchestrator)."""
 
+import queue
+import threading
+
+import pytest
+
+from agent_task_metering.evaluation import evaluator as evaluator_module
 from agent_task_metering.evaluation.audit import AuditStore
 from agent_task_metering.evaluation.contract import ContractConfig
-from agent_task_metering.evaluation.evaluator import TaskAdherenceEvaluator
+from agent_task_metering.evaluation.evaluator import (
+    TaskAdherenceEvaluator,
+    flush_decision_log,
+)
 from agent_task_metering.evaluation.models import EvaluationRequest, Evidence
 
+
+@pytest.fixture(scope="module")
+def _shared_audit_store():
+    return AuditStore()
+
+
+@pytest.fixture()
+def audit_store(_shared_audit_store):
+    """One AuditStore for the module, emptied before each test that uses it."""
+    _shared_audit_store.clear()
+    return _shared_audit_store
+
+
 # ---- Acceptance criteria --------------------------------------------------
 
 
@@ -38,6 +60,15 @@ def test_failing_payload_not_adhered_zero_units():
     assert result.billable_units == 0
 
 
+def test_default_evidence_not_adhered_zero_units():
+    """A request without evidence → adhered=False, billable_units=0."""
+    evaluator = TaskAdherenceEvaluator()
+    req = EvaluationRequest(task_id="t3", agent_id="a1", subscription_ref="sub-1")
+    result = evaluator.evaluate(req)
+    assert result.adhered is False
+    assert result.billable_units == 0
+
+
 def test_intent_not_handled_means_zero_units():
     """intent_handled=False + adhered=True → billable_units=0."""
     config = ContractConfig(require_intent_resolution=True)
@@ -75,9 +106,9 @@ def test_intent_handled_and_adhered_billable():
 # ---- Audit trail ----------------------------------------------------------
 
 
-def test_audit_record_persisted():
+def test_audit_record_persisted(audit_store):
     """Every evaluation persists an audit record."""
-    store = AuditStore()
+    store = audit_store
     evaluator = TaskAdherenceEvaluator(audit_store=store)
     req = EvaluationRequest(
         task_id="t3",
@@ -96,18 +127,12 @@ def test_audit_record_persisted():
     assert audit.billable_units == 1
 
 
-def test_multiple_evaluations_each_have_audit():
+def test_multiple_evaluations_each_have_audit(audit_store):
     """Two evaluations produce two distinct audit records."""
-    store = AuditStore()
+    store = audit_store
     evaluator = TaskAdherenceEvaluator(audit_store=store)
 
-    for i in range(2):
-        req = EvaluationRequest(
-            task_id=f"t{i}",
-            agent_id="a1",
-            subscription_ref="sub-1",
-            evidence=Evidence(outputs={"terminal_success": True}),
-        )
+    for req in [_passing_request(f"t{i}") for i in range(2)]:
         evaluator.evaluate(req)
 
     assert len(store) == 2
@@ -115,18 +140,10 @@ def test_multiple_evaluations_each_have_audit():
 
 def test_correlation_id_unique_per_call():
     """Each evaluation receives a unique correlation ID."""
-    evaluator = TaskAdherenceEvaluator()
-    ids = set()
-    for i in range(5):
-        req = EvaluationRequest(
-            task_id=f"t{i}",
-            agent_id="a1",
-            subscription_ref="sub-1",
-            evidence=Evidence(outputs={"terminal_success": True}),
-        )
-        result = evaluator.evaluate(req)
-        ids.add(result.correlation_id)
-    assert len(ids) == 5
+    evaluator = TaskAdherenceEvaluator(persist_audit=False)
+    reqs = [_passing_request(f"t{i}") for i in range(1000)]
+    ids = {evaluator.evaluate(req).correlation_id for req in reqs}
+    assert len(ids) == 1000
 
 
 def test_result_to_dict():
@@ -142,3 +159,123 @@ def test_result_to_dict():
     assert set(d.keys()) == {
         "intent_handled", "adhered", "billable_units", "reason_codes", "correlation_id",
     }
+
+
+def _passing_request(task_id="t1"):
+    return EvaluationRequest(
+        task_id=task_id,
+        agent_id="a1",
+        subscription_ref="sub-1",
+        evidence=Evidence(outputs={"terminal_success": True}),
+    )
+
+
+def test_persist_audit_false_skips_store():
+    store = AuditStore()
+    evaluator = TaskAdherenceEvaluator(audit_store=store, persist_audit=False)
+    result = evaluator.evaluate(_passing_request())
+    assert result.billable_units == 1
+    assert len(store) == 0
+
+
+def test_audit_sampler_selects_records():
+    store = AuditStore()
+    evaluator = TaskAdherenceEvaluator(
+        audit_store=store,
+        audit_sampler=lambda req: req.task_id.endswith("0"),
+    )
+    for i in range(20):
+        evaluator.evaluate(_passing_request(f"t{i}"))
+    assert sorted(r.task_id for r in store.list_records()) == ["t0", "t10"]
+
+
+def test_evaluate_many_matches_evaluate():
+    store = AuditStore()
+    evaluator = TaskAdherenceEvaluator(audit_store=store)
+    requests = [
+        _passing_request("t0"),
+        EvaluationRequest(
+            task_id="t1",
+            agent_id="a1",
+            subscription_ref="sub-1",
+            evidence=Evidence(outputs={"status": "failed"}),
+        ),
+    ]
+    results = evaluator.evaluate_many(iter(requests))
+    assert [r.billable_units for r in results] == [1, 0]
+    assert len({r.correlation_id for r in results}) == 2
+    assert [a.task_id for a in store.list_records()] == ["t0", "t1"]
+    assert store.get(results[1].correlation_id).adhered is False
+
+
+def test_evaluate_many_empty():
+    assert TaskAdherenceEvaluator().evaluate_many([]) == []
+
+
+def test_evaluate_many_failure_logs_no_decisions(monkeypatch):
+    """A request that raises mid-batch leaves no decision without its audit."""
+    logged = []
+    monkeypatch.setattr(evaluator_module, "_log_decision", lambda *d: logged.append(d))
+    store = AuditStore()
+    evaluator = TaskAdherenceEvaluator(audit_store=store)
+    broken = EvaluationRequest(
+        task_id="t1", agent_id="a1", subscription_ref="sub-1", evidence=None
+    )
+    with pytest.raises(AttributeError):
+        evaluator.evaluate_many([_passing_request("t0"), broken, _passing_request("t2")])
+    assert logged == []
+    assert len(store) == 0
+
+
+# ---- Deferred decision logging --------------------------------------------
+
+
+def test_deferred_logging_emits_after_flush(monkeypatch):
+    logged = []
+    monkeypatch.setattr(evaluator_module, "_log_decision", lambda *d: logged.append(d))
+    evaluator = TaskAdherenceEvaluator(defer_logging=True)
+    results = [
+        evaluator.evaluate(EvaluationRequest(
+            task_id=f"t{i}",
+            agent_id="a1",
+            subscription_ref="sub-1",
+            evidence=Evidence(outputs={"terminal_success": True}),
+        ))
+        for i in range(3)
+    ]
+    # Audit records are stored synchronously regardless.
+    assert len(evaluator.audit_store) == 3
+
+    flush_decision_log()
+    assert [d[0] for d in logged] == [r.correlation_id for r in results]
+    assert logged[0][1:4] == ("t0", "a1", "sub-1")
+    assert logged[0][6] == 1
+
+
+def test_deferred_logging_survives_a_failing_handler(monkeypatch, capsys):
+    logged = []
+
+    def log_decision(*decision):
+        if decision[1] == "bad":
+            raise RuntimeError("handler failed")
+        logged.append(decision[1])
+
+    monkeypatch.setattr(evaluator_module, "_log_decision", log_decision)
+    evaluator = TaskAdherenceEvaluator(defer_logging=True)
+    for task_id in ("bad", "t1"):
+        evaluator.evaluate(_passing_request(task_id))
+
+    flush_decision_log()  # would hang if the drainer had died on "bad"
+    assert logged == ["t1"]
+    assert "handler failed" in capsys.readouterr().err
+
+
+def test_flush_skips_dead_drainer(monkeypatch):
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    pending = queue.Queue()
+    pending.put(("cid", "t1", "a1", "sub-1", True, True, 1, ()))
+    monkeypatch.setattr(evaluator_module, "_drainer", dead)
+    monkeypatch.setattr(evaluator_module, "_decision_queue", pending)
+    flush_decision_log()  # returns instead of waiting on the dead thread
@@ -1,5 +1,11 @@
 """Unit tests for evaluation models."""
 
+import sys
+from dataclasses import asdict, fields
+
+import pytest
+
+from agent_task_metering.evaluation.contract import ContractConfig
 from agent_task_metering.evaluation.models import (
     AuditRecord,
     EvaluationRequest,
@@ -32,6 +38,29 @@ def test_evidence_with_data():
     assert ev.response == "It is 3pm."
 
 
+def test_evidence_as_shallow_dict_copies_top_level_only():
+    trace = {"step": "plan"}
+    ev = Evidence(outputs={"status": "completed"}, traces=[trace], query="q")
+    d = ev.as_shallow_dict()
+    assert d == {
+        "outputs": {"status": "completed"},
+        "traces": [{"step": "plan"}],
+        "scores": {},
+        "query": "q",
+        "response": None,
+    }
+    ev.outputs["extra"] = 1
+    assert "extra" not in d["outputs"]
+    assert d["traces"][0] is trace
+
+
+def test_evidence_fields_are_public():
+    assert [f.name for f in fields(Evidence)] == [
+        "outputs", "traces", "scores", "query", "response",
+    ]
+    assert Evidence(outputs={"status": "success"}) == Evidence(outputs={"status": "success"})
+
+
 def test_evaluation_request_fields():
     req = EvaluationRequest(
         task_id="t1",
@@ -100,3 +129,80 @@ def test_audit_record_default_metadata():
         reason_codes=[],
     )
     assert audit.metadata is None
+
+
+def test_audit_record_timestamp_is_epoch_ns():
+    audit = AuditRecord(
+        correlation_id="x",
+        task_id="t1",
+        agent_id="a1",
+        subscription_ref="sub-1",
+        evidence={},
+        intent_handled=False,
+        adhered=False,
+        billable_units=0,
+        reason_codes=[],
+        timestamp=1_748_786_400_123_456_789,
+    )
+    assert audit.to_dict()["timestamp"] == "2025-06-01T14:00:00.123456+00:00"
+    assert isinstance(AuditRecord(
+        correlation_id="y",
+        task_id="t1",
+        agent_id="a1",
+        subscription_ref="sub-1",
+        evidence={},
+        intent_handled=False,
+        adhered=False,
+        billable_units=0,
+        reason_codes=[],
+    ).timestamp, int)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_evaluation_dataclasses_have_no_instance_dict():
+    for obj in (
+        Evidence(),
+        EvaluationRequest(task_id="t", agent_id="a", subscription_ref="s"),
+        ContractConfig(),
+    ):
+        assert not hasattr(obj, "__dict__")
+
+
+_TO_DICT_CASES = [
+    pytest.param(
+        AuditRecord(
+            correlation_id="x",
+            task_id="t1",
+            agent_id="a1",
+            subscription_ref="sub-1",
+            evidence={"outputs": {"result": "ok"}},
+            intent_handled=True,
+            adhered=True,
+            billable_units=1,
+            reason_codes=("terminal_success:passed",),
+        ),
+        id="audit-record",
+    ),
+    pytest.param(
+        EvaluationResult(
+            intent_handled=True,
+            adhered=True,
+            billable_units=1,
+            reason_codes=(),
+            correlation_id="x",
+        ),
+        id="evaluation-result",
+    ),
+]
+
+
+@pytest.mark.parametrize("obj", _TO_DICT_CASES)
+def test_to_dict_matches_asdict(obj):
+    """Hand-written to_dict() keeps asdict()'s keys and values."""
+    d = obj.to_dict()
+    expected = asdict(obj)
+    assert set(d) == {f.name for f in fields(obj)}
+    if "timestamp" in expected:  # the one field rendered differently
+        assert isinstance(d.pop("timestamp"), str)
+        del expected["timestamp"]
+    assert d == expected
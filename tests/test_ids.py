@@ -0,0 +1,37 @@
+"""Unit tests for correlation-ID generation."""
+
+import threading
+
+from agent_task_metering._ids import new_correlation_id, new_correlation_ids
+
+
+def test_correlation_id_is_32_hex_chars():
+    cid = new_correlation_id()
+    assert len(cid) == 32
+    int(cid, 16)
+
+
+def test_correlation_ids_unique_across_buffer_refills():
+    ids = [new_correlation_id() for _ in range(1000)]
+    assert len(set(ids)) == len(ids)
+
+
+def test_correlation_ids_unique_across_threads():
+    results = []
+
+    def worker():
+        results.extend(new_correlation_id() for _ in range(300))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(set(results)) == 1200
+
+
+def test_new_correlation_ids_batch():
+    ids = new_correlation_ids(50)
+    assert len(ids) == 50 == len(set(ids))
+    assert all(len(cid) == 32 for cid in ids)
+    assert new_correlation_ids(0) == []
@@ -0,0 +1,41 @@
+"""Unit tests for the internal JSON helpers."""
+
+import importlib
+import json
+import sys
+from datetime import datetime, timezone
+
+import agent_task_metering._json as _json
+
+
+def test_dumps_returns_compact_bytes():
+    assert _json.dumps({"a": 1, "b": [1, 2]}) == b'{"a":1,"b":[1,2]}'
+
+
+def test_round_trip():
+    body = {"task_id": "t1", "ok": True, "n": None}
+    assert _json.loads(_json.dumps(body)) == body
+
+
+def test_unencodable_values_are_stringified():
+    assert isinstance(_json.loads(_json.dumps({"x": object()}))["x"], str)
+
+
+def test_dumps_indented_matches_stdlib_layout():
+    body = {"resourceId": "sub-1", "quantity": 3}
+    assert _json.dumps_indented(body) == json.dumps(body, indent=2)
+
+
+def test_stdlib_fallback(monkeypatch):
+    """Without orjson the stdlib path produces the same wire format."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    fallback = importlib.reload(_json)
+    try:
+        assert fallback.orjson is None
+        assert fallback.dumps({"a": 1}) == b'{"a":1}'
+        assert fallback.dumps_indented({"a": 1}) == '{\n  "a": 1\n}'
+        ts = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        assert fallback.loads(fallback.dumps({"ts": ts}))["ts"] == str(ts)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(_json)
@@ -1,48 +1,86 @@
 """Tests for the new MCP / OpenAPI endpoints."""
 
-import json
 import threading
 from http.client import HTTPConnection
 
 import pytest
 
-from agent_task_metering.evaluation.api import create_server
+from agent_task_metering import _json
+from agent_task_metering.evaluation.api import configure, create_server
 from agent_task_metering.metering.client import MarketplaceMeteringClient
 
 
-@pytest.fixture()
-def metering_client():
-    return MarketplaceMeteringClient(dry_run=True)
-
-
-@pytest.fixture()
-def server(metering_client):
-    """Start the API with a shared metering client on a random port."""
-    srv = create_server(host="127.0.0.1", port=0, metering_client=metering_client)
+@pytest.fixture(scope="module")
+def _server_port():
+    """Start the API once on a random free port for the whole module."""
+    srv = create_server(host="127.0.0.1", port=0)
     _, port = srv.server_address
-    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t = threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
     t.start()
-    yield port, metering_client
+    yield port
     srv.shutdown()
+    srv.server_close()
 
 
-def _post_json(port: int, path: str, body: dict) -> tuple:
-    conn = HTTPConnection("127.0.0.1", port)
-    payload = json.dumps(body).encode()
-    conn.request("POST", path, body=payload, headers={"Content-Type": "application/json"})
-    resp = conn.getresponse()
-    data = json.loads(resp.read())
-    status = resp.status
+@pytest.fixture(scope="module")
+def _conn(_server_port):
+    """One keep-alive connection reused by every test in the module."""
+    conn = HTTPConnection("127.0.0.1", _server_port)
+    yield conn
     conn.close()
-    return status, data
+
+
+@pytest.fixture()
+def metering_client():
+    """A fresh dry-run client per test, swapped into the running server."""
+    client = MarketplaceMeteringClient(dry_run=True)
+    configure(metering_client=client)
+    return client
+
+
+@pytest.fixture()
+def server(_conn, metering_client):
+    return _conn, metering_client
+
+
+_BASE = {"task_id": "t1", "agent_id": "a1", "subscription_ref": "sub-1"}
+# Canonical request bodies, encoded once; each test gets a fresh metering
+# client, so reusing the same task_id across tests is safe.
+PASS_BODY = _json.dumps(
+    {**_BASE, "evidence": {"outputs": {"terminal_success": True, "result": "ok"}}}
+)
+FAIL_BODY = _json.dumps({**_BASE, "evidence": {"outputs": {"status": "failed"}}})
+RECORD_BODY = _json.dumps({"task_id": "t-record", "subscription_ref": "sub-1"})
+
+
+def _post(conn: HTTPConnection, path: str, body) -> tuple:
+    """POST *body* (a dict, or already-encoded bytes) and return (status, raw bytes)."""
+    payload = body if isinstance(body, bytes) else _json.dumps(body)
+    headers = {"Content-Type": "application/json"}
+    try:
+        conn.request("POST", path, body=payload, headers=headers)
+        resp = conn.getresponse()
+    except ConnectionError:  # includes http.client.RemoteDisconnected
+        # The server dropped the idle connection; reconnect once and retry.
+        conn.close()
+        conn.request("POST", path, body=payload, headers=headers)
+        resp = conn.getresponse()
+    # Read the body in full so the connection can carry the next request.
+    return resp.status, resp.read()
+
+
+def _post_json(conn: HTTPConnection, path: str, body) -> tuple:
+    """Like :func:`_post`, but parse the response body as JSON."""
+    status, raw = _post(conn, path, body)
+    return status, _json.loads(raw)
 
 
 # ---- POST /evaluate_intent_handling --------------------------------------
 
 
 def test_evaluate_intent_handling_passed(server):
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_intent_handling", {
+    conn, _ = server
+    status, body = _post_json(conn, "/evaluate_intent_handling", {
         "task_id": "t1",
         "agent_id": "a1",
         "subscription_ref": "sub-1",
@@ -55,8 +93,8 @@ def test_evaluate_intent_handling_passed(server):
 
 
 def test_evaluate_intent_handling_with_caller_correlation_id(server):
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_intent_handling", {
+    conn, _ = server
+    status, body = _post_json(conn, "/evaluate_intent_handling", {
         "task_id": "t1",
         "agent_id": "a1",
         "subscription_ref": "sub-1",
@@ -67,24 +105,12 @@ def test_evaluate_intent_handling_with_caller_correlation_id(server):
     assert body["correlation_id"] == "my-custom-id"
 
 
-def test_evaluate_intent_handling_missing_fields(server):
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_intent_handling", {"task_id": "t1"})
-    assert status == 400
-    assert "Missing fields" in body["error"]
-
-
 # ---- POST /evaluate_task_adherence ----------------------------------------
 
 
 def test_evaluate_task_adherence_passed(server):
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_task_adherence", {
-        "task_id": "t1",
-        "agent_id": "a1",
-        "subscription_ref": "sub-1",
-        "evidence": {"outputs": {"terminal_success": True, "result": "ok"}},
-    })
+    conn, _ = server
+    status, body = _post_json(conn, "/evaluate_task_adherence", PASS_BODY)
     assert status == 200
     assert body["adhered"] is True
     assert "correlation_id" in body
@@ -92,13 +118,8 @@ def test_evaluate_task_adherence_passed(server):
 
 
 def test_evaluate_task_adherence_failed(server):
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_task_adherence", {
-        "task_id": "t1",
-        "agent_id": "a1",
-        "subscription_ref": "sub-1",
-        "evidence": {"outputs": {"status": "failed"}},
-    })
+    conn, _ = server
+    status, body = _post_json(conn, "/evaluate_task_adherence", FAIL_BODY)
     assert status == 200
     assert body["adhered"] is False
 
@@ -107,35 +128,44 @@ def test_evaluate_task_adherence_failed(server):
 
 
 def test_record_task_completed(server):
-    port, client = server
-    status, body = _post_json(port, "/record_task_completed", {
-        "task_id": "t-record",
-        "subscription_ref": "sub-1",
-    })
+    conn, _ = server
+    status, body = _post_json(conn, "/record_task_completed", RECORD_BODY)
     assert status == 200
     assert body["recorded"] is True
     assert "correlation_id" in body
 
 
 def test_record_task_completed_duplicate(server):
-    port, _ = server
-    _post_json(port, "/record_task_completed", {
-        "task_id": "t-dup",
-        "subscription_ref": "sub-1",
-    })
-    status, body = _post_json(port, "/record_task_completed", {
-        "task_id": "t-dup",
-        "subscription_ref": "sub-1",
-    })
+    conn, _ = server
+    _post_json(conn, "/record_task_completed", RECORD_BODY)
+    status, body = _post_json(conn, "/record_task_completed", RECORD_BODY)
     assert status == 200
     assert body["recorded"] is False
 
 
-def test_record_task_completed_missing_fields(server):
-    port, _ = server
-    status, body = _post_json(port, "/record_task_completed", {"task_id": "t1"})
-    assert status == 400
-    assert "Missing fields" in body["error"]
+@pytest.mark.parametrize(
+    "path,body",
+    [
+        ("/record_task_completed", {"task_id": 123, "subscription_ref": 456}),
+        (
+            "/evaluate_and_meter_task",
+            {
+                "task_id": 123,
+                "agent_id": "a1",
+                "subscription_ref": 456,
+                "evidence": {"outputs": {"terminal_success": True}},
+            },
+        ),
+    ],
+    ids=["record", "evaluate_and_meter"],
+)
+def test_non_str_ids_are_recorded(server, path, body):
+    """Numeric IDs from JSON are metered, not a dropped connection."""
+    conn, client = server
+    status, resp = _post_json(conn, path, body)
+    assert status == 200
+    assert resp["recorded"] is True
+    assert client.aggregate_and_submit()[0].resourceId == 456
 
 
 # ---- POST /evaluate_and_meter_task (recommended) -------------------------
@@ -143,15 +173,8 @@ def test_record_task_completed_missing_fields(server):
 
 def test_evaluate_and_meter_task_billable(server):
     """Passing evidence → billable_units=1 and recorded=True."""
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_and_meter_task", {
-        "task_id": "t-meter",
-        "agent_id": "a1",
-        "subscription_ref": "sub-1",
-        "evidence": {
-            "outputs": {"terminal_success": True, "result": "ok"},
-        },
-    })
+    conn, _ = server
+    status, body = _post_json(conn, "/evaluate_and_meter_task", PASS_BODY)
     assert status == 200
     assert body["intent_handled"] is True
     assert body["adhered"] is True
@@ -162,13 +185,8 @@ def test_evaluate_and_meter_task_billable(server):
 
 def test_evaluate_and_meter_task_not_billable(server):
     """Failing evidence → billable_units=0 and recorded=False."""
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_and_meter_task", {
-        "task_id": "t-no-meter",
-        "agent_id": "a1",
-        "subscription_ref": "sub-1",
-        "evidence": {"outputs": {"status": "failed"}},
-    })
+    conn, _ = server
+    status, body = _post_json(conn, "/evaluate_and_meter_task", FAIL_BODY)
     assert status == 200
     assert body["billable_units"] == 0
     assert body["recorded"] is False
@@ -176,8 +194,8 @@ def test_evaluate_and_meter_task_not_billable(server):
 
 def test_evaluate_and_meter_task_with_correlation_id(server):
     """Caller-supplied correlation_id is returned."""
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_and_meter_task", {
+    conn, _ = server
+    status, body = _post_json(conn, "/evaluate_and_meter_task", {
         "task_id": "t-corr",
         "agent_id": "a1",
         "subscription_ref": "sub-1",
@@ -191,7 +209,7 @@ def test_evaluate_and_meter_task_with_correlation_id(server):
 
 
 def test_evaluate_and_meter_task_missing_fields(server):
-    port, _ = server
-    status, body = _post_json(port, "/evaluate_and_meter_task", {"task_id": "t1"})
+    conn, _ = server
+    status, raw = _post(conn, "/evaluate_and_meter_task", {"task_id": "t1"})
     assert status == 400
-    assert "Missing fields" in body["error"]
+    assert b"Missing fields" in raw
@@ -2,11 +2,20 @@
 
 from datetime import datetime
 
+import pytest
+
 from agent_task_metering.meter import TaskMeter
 
+_START = datetime(2025, 1, 1, 0, 0, 0)
+_END = datetime(2025, 1, 1, 0, 1, 0)
+
+
+@pytest.fixture()
+def meter():
+    return TaskMeter()
 
-def test_record_and_summary():
-    meter = TaskMeter()
+
+def test_record_and_summary(meter):
     meter.record("t1", "agent-A", "chat", input_tokens=10, output_tokens=5)
     meter.record("t2", "agent-B", "search", input_tokens=20, output_tokens=10)
 
@@ -14,10 +23,10 @@ def test_record_and_summary():
     assert summary["total_tasks"] == 2
     assert summary["total_tokens"] == 45
     assert set(summary["agents"]) == {"agent-A", "agent-B"}
+    assert summary["tokens_by_agent"] == {"agent-A": 15, "agent-B": 30}
 
 
-def test_records_for_agent():
-    meter = TaskMeter()
+def test_records_for_agent(meter):
     meter.record("t1", "agent-A", "chat", input_tokens=10, output_tokens=5)
     meter.record("t2", "agent-A", "search", input_tokens=20, output_tokens=10)
     meter.record("t3", "agent-B", "chat", input_tokens=5, output_tokens=3)
@@ -27,26 +36,50 @@ def test_records_for_agent():
     assert all(r.agent_id == "agent-A" for r in records)
 
 
-def test_total_tokens_empty():
-    meter = TaskMeter()
+def test_total_tokens_empty(meter):
     assert meter.total_tokens() == 0
 
 
-def test_record_with_timestamps():
-    meter = TaskMeter()
-    start = datetime(2025, 1, 1, 0, 0, 0)
-    end = datetime(2025, 1, 1, 0, 1, 0)
+def test_record_with_timestamps(meter):
     record = meter.record(
         "t1", "agent-A", "chat",
         input_tokens=10, output_tokens=5,
-        start_time=start, end_time=end,
+        start_time=_START, end_time=_END,
     )
     assert record.duration_seconds == 60.0
 
 
-def test_summary_empty():
-    meter = TaskMeter()
+def test_summary_empty(meter):
     summary = meter.summary()
     assert summary["total_tasks"] == 0
     assert summary["total_tokens"] == 0
     assert summary["agents"] == []
+    assert summary["tokens_by_agent"] == {}
+
+
+def test_records_for_agent_unknown_and_copy(meter):
+    meter.record("t1", "agent-A", "chat")
+    assert meter.records_for_agent("agent-Z") == []
+
+    records = meter.records_for_agent("agent-A")
+    records.clear()
+    assert len(meter.records_for_agent("agent-A")) == 1
+
+
+def test_record_many(meter):
+    added = meter.record_many([
+        ("t1", "agent-A", "chat", 10, 5),
+        ("t2", "agent-B", "search", 20, 10),
+        ("t3", "agent-A", "chat", 1, 1),
+    ])
+    assert [r.task_id for r in added] == ["t1", "t2", "t3"]
+    assert meter.total_tokens() == 47
+    assert meter.summary()["tokens_by_agent"] == {"agent-A": 17, "agent-B": 30}
+    assert len(meter.records_for_agent("agent-A")) == 2
+
+
+def test_repeated_strings_share_one_object(meter):
+    a = meter.record("t1", "".join(["agent", "-A"]), "".join(["ch", "at"]))
+    b = meter.record("t2", "".join(["agent", "-A"]), "".join(["ch", "at"]))
+    assert a.agent_id is b.agent_id
+    assert a.task_type is b.task_type
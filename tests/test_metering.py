@@ -1,97 +1,111 @@
 """Unit tests for the metering module (MarketplaceMeteringClient)."""
 
-from datetime import datetime, timezone
+import threading
+from dataclasses import asdict, fields
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
 
 from agent_task_metering.metering.client import (
     DIMENSION,
+    GuardrailConfig,
     MarketplaceMeteringClient,
     UsageEvent,
+    _hour_bucket,
+    _iso_to_bucket,
 )
 
-# ---- Hourly aggregation --------------------------------------------------
-
-
-def test_aggregation_single_subscription():
-    """N completions in the same hour → 1 event with quantity=N."""
-    client = MarketplaceMeteringClient(dry_run=True)
-    ts = datetime(2025, 6, 1, 14, 10, 0, tzinfo=timezone.utc)
-    for i in range(12):
-        client.record_task_completed("sub-1", f"task-{i}", ts)
-
-    events = client.aggregate_and_submit("2025-06-01T14:00:00Z")
-    assert len(events) == 1
-    assert events[0].quantity == 12
-    assert events[0].resourceId == "sub-1"
-    assert events[0].dimension == DIMENSION
-    assert events[0].effectiveStartTime == "2025-06-01T14:00:00Z"
+UTC = timezone.utc
+TS_00 = datetime(2025, 6, 1, 0, 0, 0, tzinfo=UTC)
+TS_14 = datetime(2025, 6, 1, 14, 0, 0, tzinfo=UTC)
+TS_14_10 = datetime(2025, 6, 1, 14, 10, 0, tzinfo=UTC)
+TS_15 = datetime(2025, 6, 1, 15, 0, 0, tzinfo=UTC)
+_TASK_IDS = tuple(f"task-{i}" for i in range(12))
 
+# ---- Hourly aggregation --------------------------------------------------
 
-def test_aggregation_multiple_subscriptions():
-    """Different subscriptions in the same hour → separate events."""
+# Each record is (subscription_ref, task_id, timestamp, expected_accepted);
+# expected events are (resourceId, effectiveStartTime, quantity), sorted.
+_AGGREGATION_CASES = [
+    pytest.param(
+        [("sub-1", tid, TS_14_10, True) for tid in _TASK_IDS],
+        "2025-06-01T14:00:00Z",
+        [("sub-1", "2025-06-01T14:00:00Z", 12)],
+        id="single-sub",
+    ),
+    pytest.param(
+        [
+            ("sub-A", "t1", TS_14, True),
+            ("sub-A", "t2", TS_14, True),
+            ("sub-B", "t3", TS_14, True),
+        ],
+        "2025-06-01T14:00:00Z",
+        [("sub-A", "2025-06-01T14:00:00Z", 2), ("sub-B", "2025-06-01T14:00:00Z", 1)],
+        id="multiple-subs",
+    ),
+    pytest.param(
+        [
+            ("sub-1", "t1", TS_14 + timedelta(minutes=5), True),
+            ("sub-1", "t2", TS_15 + timedelta(minutes=5), True),
+        ],
+        None,
+        [("sub-1", "2025-06-01T14:00:00Z", 1), ("sub-1", "2025-06-01T15:00:00Z", 1)],
+        id="multiple-hours",
+    ),
+    pytest.param(
+        [("sub-1", "t1", TS_14, True), ("sub-1", "t1", TS_14, False)],
+        "2025-06-01T14:00:00Z",
+        [("sub-1", "2025-06-01T14:00:00Z", 1)],
+        id="duplicate-same-hour-ignored",
+    ),
+    pytest.param(
+        [("sub-1", "t1", TS_14, True), ("sub-1", "t1", TS_15, True)],
+        None,
+        [("sub-1", "2025-06-01T14:00:00Z", 1), ("sub-1", "2025-06-01T15:00:00Z", 1)],
+        id="same-task-different-hours",
+    ),
+]
+
+
+@pytest.mark.parametrize("records,window,expected", _AGGREGATION_CASES)
+def test_aggregation(records, window, expected):
+    """Completions roll up into one event per (subscription, hour)."""
     client = MarketplaceMeteringClient(dry_run=True)
-    ts = datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-    client.record_task_completed("sub-A", "t1", ts)
-    client.record_task_completed("sub-A", "t2", ts)
-    client.record_task_completed("sub-B", "t3", ts)
+    record = client.record_task_completed
+    for sub, task_id, ts, accepted in records:
+        assert record(sub, task_id, ts) is accepted
 
-    events = client.aggregate_and_submit("2025-06-01T14:00:00Z")
-    assert len(events) == 2
-    by_sub = {e.resourceId: e for e in events}
-    assert by_sub["sub-A"].quantity == 2
-    assert by_sub["sub-B"].quantity == 1
+    events = client.aggregate_and_submit(window)
+    assert sorted(
+        (e.resourceId, e.effectiveStartTime, e.quantity) for e in events
+    ) == expected
+    assert all(e.dimension == DIMENSION for e in events)
 
 
-def test_aggregation_multiple_hours():
-    """Tasks in different hours produce separate events."""
-    client = MarketplaceMeteringClient(dry_run=True)
-    client.record_task_completed(
-        "sub-1", "t1", datetime(2025, 6, 1, 14, 5, 0, tzinfo=timezone.utc)
-    )
-    client.record_task_completed(
-        "sub-1", "t2", datetime(2025, 6, 1, 15, 5, 0, tzinfo=timezone.utc)
-    )
+def test_record_many_matches_single_calls():
+    """record_many returns the same flags and totals as one call per task."""
+    guardrail = GuardrailConfig(hourly_cap=12)
+    single = MarketplaceMeteringClient(dry_run=True, guardrail_config=guardrail)
+    batched = MarketplaceMeteringClient(dry_run=True, guardrail_config=guardrail)
+    task_ids = _TASK_IDS + ("task-0", "task-extra")  # one duplicate, one over cap
 
-    events = client.aggregate_and_submit()
-    assert len(events) == 2
-    quantities = sorted(e.effectiveStartTime for e in events)
-    assert quantities == ["2025-06-01T14:00:00Z", "2025-06-01T15:00:00Z"]
+    expected = [single.record_task_completed("sub-1", t, TS_14_10) for t in task_ids]
+    assert batched.record_many("sub-1", task_ids, TS_14_10) == expected
+    assert expected[-2:] == [False, False]
+    assert batched.pending_quantity("sub-1", "2025-06-01T14:00:00Z") == 12
+    assert [e.to_dict() for e in batched.aggregate_and_submit()] == [
+        e.to_dict() for e in single.aggregate_and_submit()
+    ]
 
 
 # ---- Duplicate / idempotency --------------------------------------------
 
 
-def test_duplicate_task_same_hour_ignored():
-    """Recording the same task_id twice in the same hour is idempotent."""
-    client = MarketplaceMeteringClient(dry_run=True)
-    ts = datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-
-    assert client.record_task_completed("sub-1", "t1", ts) is True
-    assert client.record_task_completed("sub-1", "t1", ts) is False  # dup
-
-    events = client.aggregate_and_submit("2025-06-01T14:00:00Z")
-    assert events[0].quantity == 1
-
-
-def test_same_task_different_hours_both_counted():
-    """Same task_id in different hours is treated as two distinct events."""
-    client = MarketplaceMeteringClient(dry_run=True)
-    assert client.record_task_completed(
-        "sub-1", "t1", datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-    ) is True
-    assert client.record_task_completed(
-        "sub-1", "t1", datetime(2025, 6, 1, 15, 0, 0, tzinfo=timezone.utc)
-    ) is True
-
-    events = client.aggregate_and_submit()
-    assert len(events) == 2
-    assert all(e.quantity == 1 for e in events)
-
-
 def test_resubmit_same_window_idempotent():
     """Calling aggregate_and_submit for the same window twice is a no-op."""
     client = MarketplaceMeteringClient(dry_run=True)
-    ts = datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-    client.record_task_completed("sub-1", "t1", ts)
+    client.record_task_completed("sub-1", "t1", TS_14)
 
     first = client.aggregate_and_submit("2025-06-01T14:00:00Z")
     second = client.aggregate_and_submit("2025-06-01T14:00:00Z")
@@ -105,8 +119,7 @@ def test_resubmit_same_window_idempotent():
 def test_dimension_is_task_completed():
     """Every event uses the canonical 'task_completed' dimension."""
     client = MarketplaceMeteringClient(dry_run=True)
-    ts = datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-    client.record_task_completed("sub-1", "t1", ts)
+    client.record_task_completed("sub-1", "t1", TS_14)
 
     events = client.aggregate_and_submit()
     assert all(e.dimension == "task_completed" for e in events)
@@ -115,20 +128,42 @@ def test_dimension_is_task_completed():
 # ---- Dry-run & callback --------------------------------------------------
 
 
-def test_dry_run_does_not_call_callback(capsys):
+def test_dry_run_does_not_call_callback():
     """In dry-run mode the callback is NOT invoked, but output is printed."""
     called = []
+    lines = []
     client = MarketplaceMeteringClient(
-        dry_run=True, submit_callback=lambda e: called.append(e)
+        dry_run=True, submit_callback=lambda e: called.append(e), print_fn=lines.append
     )
-    ts = datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-    client.record_task_completed("sub-1", "t1", ts)
+    client.record_task_completed("sub-1", "t1", TS_14)
     client.aggregate_and_submit()
 
     assert len(called) == 0
-    captured = capsys.readouterr()
-    assert "[dry-run]" in captured.out
-    assert "task_completed" in captured.out
+    assert any("[dry-run]" in line and "task_completed" in line for line in lines)
+
+
+def test_dry_run_prints_one_line_per_event(capsys):
+    client = MarketplaceMeteringClient(dry_run=True, plan_id="plan-a")
+    client.record_task_completed("sub-1", "t1", TS_14)
+    client.aggregate_and_submit()
+
+    line = capsys.readouterr().out.splitlines()[0]
+    assert line == (
+        "[dry-run] Usage event: resourceId=sub-1 quantity=1 "
+        "dimension=task_completed effectiveStartTime=2025-06-01T14:00:00Z "
+        "planId=plan-a"
+    )
+
+
+def test_dry_run_pretty_prints_json():
+    lines = []
+    client = MarketplaceMeteringClient(
+        dry_run=True, dry_run_pretty=True, print_fn=lines.append
+    )
+    client.record_task_completed("sub-1", "t1", TS_14)
+    client.aggregate_and_submit()
+
+    assert '"resourceId": "sub-1"' in lines[0]
 
 
 def test_callback_invoked_when_not_dry_run():
@@ -137,8 +172,7 @@ def test_callback_invoked_when_not_dry_run():
     client = MarketplaceMeteringClient(
         dry_run=False, submit_callback=lambda e: submitted.append(e)
     )
-    ts = datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-    client.record_task_completed("sub-1", "t1", ts)
+    client.record_task_completed("sub-1", "t1", TS_14)
     client.aggregate_and_submit()
 
     assert len(submitted) == 1
@@ -151,14 +185,26 @@ def test_callback_invoked_when_not_dry_run():
 
 def test_pending_quantity():
     client = MarketplaceMeteringClient(dry_run=True)
-    ts = datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-    client.record_task_completed("sub-1", "t1", ts)
-    client.record_task_completed("sub-1", "t2", ts)
+    client.record_task_completed("sub-1", "t1", TS_14)
+    client.record_task_completed("sub-1", "t2", TS_14)
 
     assert client.pending_quantity("sub-1", "2025-06-01T14:00:00Z") == 2
     assert client.pending_quantity("sub-1", "2025-06-01T15:00:00Z") == 0
 
 
+def test_hour_bucket_normalizes_timezones():
+    """Offset-aware and naive (UTC) timestamps land in the same UTC hour."""
+    client = MarketplaceMeteringClient(dry_run=True)
+    plus_two = timezone(timedelta(hours=2))
+    client.record_task_completed("sub-1", "t1", datetime(2025, 6, 1, 16, 10, tzinfo=plus_two))
+    client.record_task_completed("sub-1", "t2", datetime(2025, 6, 1, 14, 50))
+
+    assert client.pending_quantity("sub-1", "2025-06-01T14:00:00Z") == 2
+    assert client.pending_quantity("sub-1", "2025-06-01T14:00:00+00:00") == 2
+    events = client.aggregate_and_submit("2025-06-01T14:00:00Z")
+    assert [e.effectiveStartTime for e in events] == ["2025-06-01T14:00:00Z"]
+
+
 def test_usage_event_to_dict():
     event = UsageEvent(
         resourceId="sub-1",
@@ -185,7 +231,306 @@ def test_record_default_timestamp():
 
 def test_plan_id_propagated():
     client = MarketplaceMeteringClient(dry_run=True, plan_id="enterprise")
-    ts = datetime(2025, 6, 1, 14, 0, 0, tzinfo=timezone.utc)
-    client.record_task_completed("sub-1", "t1", ts)
+    client.record_task_completed("sub-1", "t1", TS_14)
     events = client.aggregate_and_submit()
     assert events[0].planId == "enterprise"
+
+
+# ---- Batch submission ----------------------------------------------------
+
+
+def test_batch_callback_chunks_of_25():
+    """Events are submitted in batches of at most 25 records."""
+    batches = []
+    client = MarketplaceMeteringClient(
+        dry_run=False, batch_submit_callback=lambda b: batches.append(b)
+    )
+    for i in range(60):
+        client.record_task_completed(f"sub-{i}", "t1", TS_14)
+
+    events = client.aggregate_and_submit()
+    assert len(events) == 60
+    assert [len(b) for b in batches] == [25, 25, 10]
+    assert batches[0][0]["dimension"] == "task_completed"
+
+
+def test_batch_size_configurable():
+    batches = []
+    client = MarketplaceMeteringClient(
+        dry_run=False, batch_submit_callback=batches.append, batch_size=10
+    )
+    for i in range(23):
+        client.record_task_completed(f"sub-{i}", "t1", TS_14)
+    client.aggregate_and_submit()
+    assert [len(b) for b in batches] == [10, 10, 3]
+
+
+def test_batch_size_bounded_by_marketplace_limit():
+    with pytest.raises(ValueError):
+        MarketplaceMeteringClient(batch_size=26)
+    with pytest.raises(ValueError):
+        MarketplaceMeteringClient(batch_size=0)
+
+
+def test_batch_split_when_payload_too_large(monkeypatch):
+    """A batch whose encoded size exceeds the payload cap is halved."""
+    import agent_task_metering.metering.client as client_mod
+
+    monkeypatch.setattr(client_mod, "_PAYLOAD_MAX", 400)
+    batches = []
+    client = MarketplaceMeteringClient(
+        dry_run=False, batch_submit_callback=lambda b: batches.append(b)
+    )
+    for i in range(8):
+        client.record_task_completed(f"sub-{i}", "t1", TS_14)
+
+    client.aggregate_and_submit()
+    assert sum(len(b) for b in batches) == 8
+    assert len(batches) > 1
+
+
+def test_failed_batch_left_pending_for_retry():
+    """Windows in a failed batch are not marked submitted."""
+    calls = []
+
+    def flaky(batch):
+        calls.append(batch)
+        if len(calls) == 2:
+            raise ConnectionError("boom")
+
+    client = MarketplaceMeteringClient(dry_run=False, batch_submit_callback=flaky)
+    for i in range(30):
+        client.record_task_completed(f"sub-{i}", "t1", TS_14)
+
+    try:
+        client.aggregate_and_submit()
+    except ConnectionError:
+        pass
+
+    retry = client.aggregate_and_submit()
+    assert len(retry) == 5
+    assert [e.resourceId for e in retry] == [e["resourceId"] for e in calls[1]]
+
+
+def test_iso_to_bucket_is_memoized():
+    _iso_to_bucket.cache_clear()
+    expected = _hour_bucket(TS_14)
+    assert _iso_to_bucket("2025-06-01T14:00:00Z") == expected
+    assert _iso_to_bucket("2025-06-01T14:00:00Z") == expected
+    assert _iso_to_bucket.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "hour_window", ["garbage", "2025-06-01T14:30:00Z", "2025-06-01T14:00:00+05:30"]
+)
+def test_non_hour_key_window_matches_nothing(hour_window):
+    client = MarketplaceMeteringClient(dry_run=True)
+    client.record_task_completed("sub-1", "t1", TS_14_10)
+    assert _iso_to_bucket(hour_window) is None
+    assert client.pending_quantity("sub-1", hour_window) == 0
+    assert client.aggregate_and_submit(hour_window=hour_window) == []
+    assert client.pending_quantity("sub-1", "2025-06-01T14:00:00Z") == 1
+
+
+def test_usage_event_to_dict_covers_every_field():
+    event = UsageEvent(
+        resourceId="sub-1",
+        quantity=3,
+        dimension=DIMENSION,
+        effectiveStartTime="2025-06-01T14:00:00Z",
+        planId="plan",
+    )
+    d = event.to_dict()
+    assert set(d) == {f.name for f in fields(UsageEvent)}
+    assert d == asdict(event)
+
+
+def test_hour_window_aggregation_uses_recording_order():
+    client = MarketplaceMeteringClient(dry_run=True)
+    for sub in ("sub-c", "sub-a", "sub-b"):
+        client.record_task_completed(sub, "t1", TS_14)
+        client.record_task_completed(sub, "t1", TS_15)
+    events = client.aggregate_and_submit(hour_window="2025-06-01T14:00:00Z")
+    assert [e.resourceId for e in events] == ["sub-c", "sub-a", "sub-b"]
+    assert client.aggregate_and_submit(hour_window="2025-06-01T16:00:00Z") == []
+
+
+def test_capped_attempt_leaves_no_empty_window():
+    client = MarketplaceMeteringClient(
+        dry_run=True, guardrail_config=GuardrailConfig(daily_cap=1)
+    )
+    assert client.record_task_completed("sub-1", "t1", TS_14) is True
+    assert client.record_task_completed("sub-1", "t2", TS_14 + timedelta(hours=1)) is False
+    assert len(client._completions) == 1
+    assert [e.quantity for e in client.aggregate_and_submit()] == [1]
+
+
+def test_submitted_windows_leave_the_pending_set():
+    client = MarketplaceMeteringClient(dry_run=True)
+    client.record_task_completed("sub-1", "t1", TS_14)
+    client.record_task_completed("sub-2", "t1", TS_14)
+    client.aggregate_and_submit(hour_window="2025-06-01T14:00:00Z")
+    assert client._pending == {}
+    client.record_task_completed("sub-3", "t1", TS_14 + timedelta(hours=1))
+    assert [e.resourceId for e in client.aggregate_and_submit()] == ["sub-3"]
+
+
+# ---- Retention ------------------------------------------------------------
+
+
+def test_retention_frees_submitted_windows_and_rejects_late_tasks():
+    client = MarketplaceMeteringClient(
+        dry_run=True, guardrail_config=GuardrailConfig(retention_hours=2)
+    )
+    for h in range(5):
+        assert client.record_task_completed("sub-1", "t1", TS_00 + timedelta(hours=h))
+    client.aggregate_and_submit()
+
+    # Hours 0-2 are at or behind the horizon (newest 4 - 2) and were submitted.
+    assert sorted(b - _hour_bucket(TS_00) for _, b in client._quantities) == [3, 4]
+    assert client.record_task_completed("sub-1", "t2", TS_00) is False
+    assert client.record_task_completed("sub-1", "t2", TS_00 + timedelta(hours=3))
+
+
+def test_retention_keeps_unsubmitted_windows():
+    client = MarketplaceMeteringClient(
+        dry_run=True, guardrail_config=GuardrailConfig(retention_hours=1)
+    )
+    client.record_task_completed("sub-1", "t1", TS_00)
+    client.record_task_completed("sub-1", "t1", TS_00 + timedelta(hours=3))
+    client.aggregate_and_submit(hour_window="2025-06-01T03:00:00Z")
+    assert client.pending_quantity("sub-1", "2025-06-01T00:00:00Z") == 1
+    assert [e.effectiveStartTime for e in client.aggregate_and_submit()] == [
+        "2025-06-01T00:00:00Z"
+    ]
+    assert client.pending_quantity("sub-1", "2025-06-01T00:00:00Z") == 0
+
+
+def test_retention_horizon_is_per_subscription():
+    client = MarketplaceMeteringClient(
+        dry_run=True, guardrail_config=GuardrailConfig(retention_hours=2)
+    )
+    # sub-skewed reports completions a day in the future.
+    assert client.record_task_completed("sub-skewed", "t1", TS_00 + timedelta(days=1))
+    assert client.record_task_completed("sub-1", "t1", TS_00)
+    assert client.record_task_completed("sub-1", "t2", TS_00 + timedelta(hours=1))
+    client.aggregate_and_submit()
+
+    # sub-1's submitted hours are still inside its own window.
+    assert client.pending_quantity("sub-1", "2025-06-01T00:00:00Z") == 1
+    assert client.record_task_completed("sub-1", "t3", TS_00)
+    assert client.record_task_completed("sub-skewed", "t2", TS_00) is False
+
+# ---- Audit modes ----------------------------------------------------------
+
+
+def _recorded_events(log_event):
+    return [c for c in log_event.call_args_list if c.args[0] == "task_recorded"]
+
+
+def test_batched_audit_mode_flushes_before_aggregation():
+    client = MarketplaceMeteringClient(dry_run=True, audit_mode="batched")
+    with mock.patch("agent_task_metering.metering.client._log") as log:
+        client._sink._audit = log
+        for i in range(5):
+            assert client.record_task_completed("sub-1", f"t{i}", TS_14, "cid") is True
+        client.aggregate_and_submit()
+    names = [c.args[0] for c in log.log_event.call_args_list]
+    assert names[:5] == ["task_recorded"] * 5
+    assert names.index("aggregation_complete") == 5
+    assert _recorded_events(log.log_event)[0].kwargs["task_id"] == "t0"
+
+
+def test_none_audit_mode_skips_task_recorded():
+    client = MarketplaceMeteringClient(dry_run=True, audit_mode="none")
+    with mock.patch("agent_task_metering.metering.client._log") as log:
+        assert client.record_task_completed("sub-1", "t1", TS_14) is True
+        assert client.record_task_completed("sub-1", "t1", TS_14) is False
+    assert _recorded_events(log.log_event) == []
+    assert log.log_event.call_args_list[0].args[0] == "task_recording_duplicate"
+
+
+def test_invalid_audit_mode_rejected():
+    with pytest.raises(ValueError):
+        MarketplaceMeteringClient(audit_mode="loud")
+
+
+# ---- Concurrency ----------------------------------------------------------
+
+
+@pytest.mark.slow
+def test_concurrent_recording_is_exact():
+    """Racing recorders neither double-count duplicates nor overshoot caps."""
+    client = MarketplaceMeteringClient(
+        dry_run=True, guardrail_config=GuardrailConfig(hourly_cap=150)
+    )
+    accepted = []
+    task_ids = [f"t{i}" for i in range(200)]
+
+    def worker():
+        record, accept = client.record_task_completed, accepted.append
+        for task_id in task_ids:
+            for sub in ("sub-1", "sub-2"):
+                if record(sub, task_id, TS_14):
+                    accept(sub)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert accepted.count("sub-1") == accepted.count("sub-2") == 150
+    assert client.pending_quantity("sub-1", "2025-06-01T14:00:00Z") == 150
+
+
+@pytest.mark.slow
+def test_concurrent_aggregation_submits_each_window_once():
+    submitted = []
+    client = MarketplaceMeteringClient(dry_run=False, submit_callback=submitted.append)
+    for i in range(10):
+        client.record_task_completed(f"sub-{i}", "t1", TS_14)
+
+    threads = [threading.Thread(target=client.aggregate_and_submit) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(e["resourceId"] for e in submitted) == [f"sub-{i}" for i in range(10)]
+
+
+@pytest.mark.slow
+def test_recording_during_submission_loses_no_window():
+    """Windows recorded while other threads submit are each sent exactly once."""
+    submitted = []
+    client = MarketplaceMeteringClient(
+        dry_run=False,
+        submit_callback=submitted.append,
+        guardrail_config=GuardrailConfig(retention_hours=24),
+    )
+    done = threading.Event()
+
+    def recorder(sub):
+        for h in range(200):
+            # One task per hour, so every recording opens a new window.
+            assert client.record_task_completed(sub, "t1", TS_00 + timedelta(hours=h))
+
+    def submitter():
+        while not done.is_set():
+            client.aggregate_and_submit()
+
+    recorders = [threading.Thread(target=recorder, args=(f"sub-{i}",)) for i in range(4)]
+    submitters = [threading.Thread(target=submitter) for _ in range(2)]
+    for t in submitters + recorders:
+        t.start()
+    for t in recorders:
+        t.join()
+    done.set()
+    for t in submitters:
+        t.join()
+    client.aggregate_and_submit()
+
+    windows = [(e["resourceId"], e["effectiveStartTime"]) for e in submitted]
+    assert len(windows) == len(set(windows)) == 4 * 200
+    assert all(e["quantity"] == 1 for e in submitted)
@@ -1,9 +1,14 @@
 """Unit tests for TaskRecord model."""
 
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
+
+import pytest
 
 from agent_task_metering.models import TaskRecord
 
+_START = datetime(2025, 1, 1, 0, 0, 0)
+
 
 def test_task_record_defaults():
     record = TaskRecord(task_id="t1", agent_id="a1", task_type="chat")
@@ -16,12 +21,16 @@ def test_task_record_defaults():
     assert record.metadata == {}
 
 
-def test_total_tokens():
+@pytest.mark.parametrize(
+    "input_tokens,output_tokens,total",
+    [(100, 50, 150), (0, 0, 0), (1, 2, 3)],
+)
+def test_total_tokens(input_tokens, output_tokens, total):
     record = TaskRecord(
         task_id="t2", agent_id="a1", task_type="chat",
-        input_tokens=100, output_tokens=50,
+        input_tokens=input_tokens, output_tokens=output_tokens,
     )
-    assert record.total_tokens == 150
+    assert record.total_tokens == total
 
 
 def test_duration_seconds_none_when_not_complete():
@@ -29,9 +38,20 @@ def test_duration_seconds_none_when_not_complete():
     assert record.duration_seconds is None
 
 
-def test_duration_seconds():
-    start = datetime(2025, 1, 1, 0, 0, 0)
-    end = datetime(2025, 1, 1, 0, 0, 30)
+@pytest.mark.parametrize(
+    "end,duration",
+    [(_START + timedelta(seconds=30), 30.0), (_START, 0.0), (_START + timedelta(hours=1), 3600.0)],
+    ids=["30s", "zero", "1h"],
+)
+def test_duration_seconds(end, duration):
     record = TaskRecord(task_id="t4", agent_id="a1", task_type="chat",
-                        start_time=start, end_time=end)
-    assert record.duration_seconds == 30.0
+                        start_time=_START, end_time=end)
+    assert record.duration_seconds == duration
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+def test_task_record_has_no_instance_dict():
+    record = TaskRecord(task_id="t5", agent_id="a1", task_type="chat")
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unknown = 1  # type: ignore[attr-defined]